@@ -1,46 +1,74 @@
 """PreApply - Deterministic infrastructure risk analysis engine."""
 
-from typing import Dict, Any
-from pydantic import ValidationError
-from .ingest.plan_loader import load_plan_json
-from .ingest.plan_normalizer import normalize_plan
-from .graph.dependency_graph import DependencyGraph
-from .analysis.risk_scoring import calculate_risk_score
-from .analysis.recommendations import generate_recommendations
-from .analysis.security_exposure import detect_security_exposures
-from .analysis.cost_analysis import detect_cost_alerts
-from .analysis.state_destructive import detect_state_destructive_updates
-from .contracts.core_output import CoreOutput, RiskLevel
-from .config import load_scoring_config
-from .utils.logging import setup_logging, get_logger
+from typing import TYPE_CHECKING, Dict, Any
 from .utils.errors import PreApplyError
 
+if TYPE_CHECKING:
+    from .contracts.core_output import CoreOutput
+
 __version__ = "1.0.3"
 
 __all__ = ["analyze"]
 
-setup_logging()
-logger = get_logger("preapply")
+# The analysis stack (pydantic, networkx, yaml) is imported lazily inside
+# analyze() so `import preapply` stays cheap for callers that only need
+# __version__ or the CLI's cold start.
+_logger = None
+
+
+def _get_logger():
+    """Configure logging on first use rather than at import time."""
+    global _logger
+    if _logger is None:
+        from .utils.logging import setup_logging, get_logger
+        setup_logging()
+        _logger = get_logger("preapply")
+    return _logger
+
+
+def analyze(
+    plan_json_path: str,
+    config_path: str = None,
+    format_human: bool = False,
+    return_model: bool = False,
+    plan_data: Dict[str, Any] = None,
+) -> Dict[str, Any]:
+    """Analyze Terraform plan and return risk assessment.
+
+    With return_model=True the CoreOutput pydantic model is returned as-is,
+    letting JSON-bound callers serialize once via model_dump_json() instead
+    of paying for a full dict conversion they immediately re-encode.
 
+    Callers that already parsed the plan file can pass plan_data to skip the
+    re-read and re-parse; plan_json_path is then only used for log messages.
+    """
+    from .ingest.plan_loader import load_plan_json
+    from .ingest.plan_normalizer import normalize_plan
+    from .graph.dependency_graph import DependencyGraph
+    from .analysis.risk_scoring import calculate_risk_score
+    from .analysis.recommendations import generate_recommendations
+    from .analysis.cost_analysis import detect_cost_alerts
+    from .analysis.plan_scan import scan_plan
+    from .contracts.core_output import CoreOutput, RiskLevel
+    from .config import load_scoring_config
+
+    logger = _get_logger()
 
-def analyze(plan_json_path: str, config_path: str = None, format_human: bool = False) -> Dict[str, Any]:
-    """Analyze Terraform plan and return risk assessment."""
     try:
         logger.info(f"Starting analysis of plan: {plan_json_path}")
-        
+
         config = load_scoring_config(config_path)
-        plan_data = load_plan_json(plan_json_path)
+        plan_data = load_plan_json(plan_json_path, plan_data=plan_data)
         normalized_plan = normalize_plan(plan_data)
-        
+
         if not normalized_plan.resources:
             logger.warning("No resources found in plan")
-            return _create_empty_output()
-        
+            return _create_empty_output(return_model=return_model)
+
         graph = DependencyGraph()
         graph.build_from_resources(normalized_plan.resources)
-        security_exposures = detect_security_exposures(plan_data)
+        security_exposures, state_destructive_updates = scan_plan(plan_data)
         cost_alerts = detect_cost_alerts(plan_data, config)
-        state_destructive_updates = detect_state_destructive_updates(plan_data)
         risk_score = calculate_risk_score(
             graph, config,
             security_exposures=security_exposures,
@@ -48,33 +76,34 @@ def analyze(plan_json_path: str, config_path: str = None, format_human: bool = F
             state_destructive_updates=state_destructive_updates,
         )
         recommendations = generate_recommendations(graph, risk_score, config)
-        
-        try:
-            output = CoreOutput(
-                version="1.0.0",
-                risk_level=RiskLevel(risk_score["risk_level"]),
-                risk_level_detailed=risk_score.get("risk_level_detailed"),
-                blast_radius_score=risk_score["blast_radius_score"],
-                risk_action=risk_score.get("risk_action"),
-                approval_required=risk_score.get("approval_required"),
-                affected_components=risk_score.get("affected_components", []),
-                affected_count=risk_score.get("affected_count", 0),
-                deletion_count=risk_score.get("deletion_count", 0),
-                risk_attributes=risk_score.get("risk_attributes"),
-                risk_factors=risk_score.get("contributing_factors", []),
-                recommendations=recommendations
-            )
-        except ValidationError as e:
-            raise
-        
+
+        output = CoreOutput(
+            version="1.0.0",
+            risk_level=RiskLevel(risk_score["risk_level"]),
+            risk_level_detailed=risk_score.get("risk_level_detailed"),
+            blast_radius_score=risk_score["blast_radius_score"],
+            risk_action=risk_score.get("risk_action"),
+            approval_required=risk_score.get("approval_required"),
+            affected_components=risk_score.get("affected_components", []),
+            affected_count=risk_score.get("affected_count", 0),
+            deletion_count=risk_score.get("deletion_count", 0),
+            risk_attributes=risk_score.get("risk_attributes"),
+            risk_factors=risk_score.get("contributing_factors", []),
+            recommendations=recommendations
+        )
+
         logger.info(f"Analysis complete: {output.risk_level} risk (score: {output.blast_radius_score})")
-        
+
         if format_human:
             from .presentation.human_formatter import format_human_friendly
-            return {"formatted": format_human_friendly(output), "structured": output.model_dump()}
-        
-        return output.model_dump()
-        
+            structured = output if return_model else _dump_output(output)
+            return {"formatted": format_human_friendly(output), "structured": structured}
+
+        if return_model:
+            return output
+
+        return _dump_output(output)
+
     except PreApplyError:
         raise
     except Exception as e:
@@ -82,8 +111,21 @@ def analyze(plan_json_path: str, config_path: str = None, format_human: bool = F
         raise PreApplyError(f"Analysis failed: {e}") from e
 
 
-def _create_empty_output() -> Dict[str, Any]:
+def _dump_output(output: "CoreOutput") -> Dict[str, Any]:
+    """Serialize CoreOutput to a plain dict.
+
+    With orjson installed this goes through pydantic's Rust JSON core plus
+    orjson.loads, which is faster than the Python-level model_dump recursion.
+    """
+    from .utils.jsonio import HAVE_ORJSON, loads as json_loads
+    if HAVE_ORJSON:
+        return json_loads(output.model_dump_json())
+    return output.model_dump()
+
+
+def _create_empty_output(return_model: bool = False) -> Dict[str, Any]:
     """Create empty output for plans with no changes."""
+    from .contracts.core_output import CoreOutput, RiskLevel
     from .contracts.risk_attributes import RiskAttributes, BlastRadiusMetrics
     output = CoreOutput(
         version="1.0.0",
@@ -105,4 +147,6 @@ def _create_empty_output() -> Dict[str, Any]:
         risk_factors=[],
         recommendations=[]
     )
+    if return_model:
+        return output
     return output.model_dump()
@@ -0,0 +1,98 @@
+"""On-disk cache for AI advisor responses (advisory only)."""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger("ai.cache")
+
+# Cached answers expire after a week; the analysis fingerprint already
+# invalidates them the moment the plan or its risk assessment changes.
+_DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+_DEFAULT_MAX_ENTRIES = 256
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of advisor responses.
+
+    Entries are keyed on (analysis fingerprint, normalized question, model),
+    so re-asking the same question about an unchanged analysis skips the LLM
+    call entirely. The cache is best-effort: any storage error degrades to a
+    miss and the advisor is consulted as usual.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ):
+        self.db_path = Path(db_path) if db_path else Path.home() / ".preapply" / "ai_cache.db"
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._conn = None
+
+    @staticmethod
+    def fingerprint(core_output) -> str:
+        """Content hash of a CoreOutput, stable across identical analyses."""
+        return hashlib.sha256(core_output.model_dump_json().encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _normalize(question: str) -> str:
+        """Collapse case and whitespace so trivial rephrasings still hit."""
+        return " ".join(question.lower().split())
+
+    def _get_conn(self):
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "fingerprint TEXT, question TEXT, model TEXT, "
+                "response TEXT, ts INTEGER, "
+                "PRIMARY KEY (fingerprint, question, model))"
+            )
+        return self._conn
+
+    def get(self, fingerprint: str, question: str, model: str) -> Optional[str]:
+        """Return a cached response, or None on miss/expiry/storage error."""
+        try:
+            conn = self._get_conn()
+            row = conn.execute(
+                "SELECT response, ts FROM responses "
+                "WHERE fingerprint = ? AND question = ? AND model = ?",
+                (fingerprint, self._normalize(question), model),
+            ).fetchone()
+        except Exception as e:
+            logger.debug("AI cache lookup failed: %s", e)
+            return None
+        if row is None:
+            return None
+        response, ts = row
+        if time.time() - ts > self.ttl_seconds:
+            return None
+        return response
+
+    def put(self, fingerprint: str, question: str, model: str, response: str) -> None:
+        """Store a response, pruning expired and excess entries."""
+        try:
+            conn = self._get_conn()
+            now = int(time.time())
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (fingerprint, self._normalize(question), model, response, now),
+            )
+            conn.execute("DELETE FROM responses WHERE ts < ?", (now - self.ttl_seconds,))
+            conn.execute(
+                "DELETE FROM responses WHERE rowid NOT IN ("
+                "SELECT rowid FROM responses ORDER BY ts DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            conn.commit()
+        except Exception as e:
+            logger.debug("AI cache write failed: %s", e)
@@ -1,14 +1,20 @@
 """Ollama adapter for AI advisor (optional)."""
 
+import json
 import os
-from typing import Optional
+from time import monotonic
+from typing import Iterator, Optional
 from ..contracts.core_output import CoreOutput
 from ..utils.errors import PreApplyError
+from ..utils.jsonio import dumps_bytes
 from ..utils.logging import get_logger
 from .base import AIAdvisor
 
 logger = get_logger("ai.ollama")
 
+# How long a successful availability probe stays valid before re-checking.
+_AVAILABILITY_TTL_SECONDS = 30.0
+
 
 class OllamaAdvisor(AIAdvisor):
     """
@@ -17,29 +23,63 @@ class OllamaAdvisor(AIAdvisor):
     Requires Ollama to be installed and running locally.
     """
     
-    def __init__(self, model: str = "llama3.2", base_url: Optional[str] = None):
+    def __init__(
+        self,
+        model: str = "llama3.2",
+        base_url: Optional[str] = None,
+        session=None,
+    ):
         """
         Initialize Ollama advisor.
-        
+
         Args:
             model: Ollama model name (default: llama3.2)
             base_url: Ollama API base URL (default: http://localhost:11434)
+            session: Optional requests.Session to reuse; lets callers share
+                one keep-alive connection pool across several advisors
+                (e.g. different models against the same server)
         """
         self.model = model
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+        self._session = session
+        self._available_until = 0.0
         self._check_ollama_available()
-    
+
+    def _get_session(self):
+        """Get the shared HTTP session (keep-alive connection pooling).
+
+        Reusing one session avoids a TCP handshake per Ollama call when the
+        availability probe and repeated questions hit the same host.
+        """
+        if self._session is None:
+            try:
+                import requests
+            except ImportError:
+                raise PreApplyError("requests package required for Ollama adapter. Install with: pip install requests")
+            self._session = requests.Session()
+        return self._session
+
     def _check_ollama_available(self) -> None:
-        """Check if Ollama is available."""
+        """Check if Ollama is available (cached for a short TTL).
+
+        __init__ probes the server, and health-check paths often call
+        is_available() right after construction; the TTL avoids paying a
+        second HTTP round trip for the same answer.
+        """
+        if monotonic() < self._available_until:
+            return
         try:
-            import requests
-            response = requests.get(f"{self.base_url}/api/tags", timeout=2)
+            session = self._get_session()
+            response = session.get(f"{self.base_url}/api/tags", timeout=2)
             response.raise_for_status()
+        except PreApplyError:
+            raise
         except Exception as e:
             raise PreApplyError(
                 f"Ollama not available at {self.base_url}. "
                 f"Make sure Ollama is installed and running. Error: {e}"
             )
+        self._available_until = monotonic() + _AVAILABILITY_TTL_SECONDS
     
     def ask(
         self,
@@ -58,37 +98,69 @@ class OllamaAdvisor(AIAdvisor):
         Returns:
             Advisory response from Ollama
         """
+        return "".join(self.ask_stream(core_output, question, max_tokens)).strip()
+
+    def ask_stream(
+        self,
+        core_output: CoreOutput,
+        question: str,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Ask Ollama about the CoreOutput, yielding response chunks as they arrive.
+
+        Streaming avoids buffering the full generation server-side, so the
+        first tokens are available immediately and peak memory stays flat.
+
+        Args:
+            core_output: CoreOutput from analysis
+            question: User's question
+            max_tokens: Optional max tokens (Ollama uses num_predict)
+
+        Yields:
+            Response text chunks from Ollama
+        """
         from .prompt import build_prompt
-        
-        try:
-            import requests
-        except ImportError:
-            raise PreApplyError("requests package required for Ollama adapter. Install with: pip install requests")
-        
+
+        import requests
+        session = self._get_session()
+
         prompt = build_prompt(core_output, question)
-        
-        # Ollama API request
+
+        # Ollama API request (streaming: one JSON object per line)
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False
+            "stream": True
         }
-        
+
         if max_tokens:
             payload["options"] = {"num_predict": max_tokens}
-        
+
         try:
-            response = requests.post(
+            # Pre-encode the payload (which embeds the full prompt) instead of
+            # letting requests run stdlib json.dumps on it per call.
+            response = session.post(
                 f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=60
+                data=dumps_bytes(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=60,
+                stream=True
             )
             response.raise_for_status()
-            
-            result = response.json()
-            return result.get("response", "").strip()
-            
+
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                text = chunk.get("response")
+                if text:
+                    yield text
+                if chunk.get("done"):
+                    break
+
         except requests.exceptions.RequestException as e:
+            self._available_until = 0.0
             logger.error(f"Ollama API error: {e}")
             raise PreApplyError(f"Failed to get response from Ollama: {e}")
     
@@ -5,12 +5,57 @@ from typing import List
 from ..contracts.core_output import CoreOutput
 from ..presentation.explainer import explain_overall_with_id
 
+# Template pieces shared by PromptContract and the inline build path.
+_PROMPT_TEMPLATE = """You are an AI advisor for PreApply, an infrastructure risk analysis tool.
+
+CRITICAL CONSTRAINTS (NON-NEGOTIABLE):
+- You are NOT allowed to change risk levels, scores, policy decisions, or enforcement outcomes.
+- You are providing ADVISORY information only.
+- All risk facts come from the deterministic analysis below.
+- You cannot override or modify the analysis results.
+
+DETERMINISTIC ANALYSIS RESULTS:
+{blast_summary}
+
+Explanation ID: {explanation_id}
+
+Deterministic Explanation:
+{explanation_text}
+
+Recommendations:
+{recs_text}
+
+USER QUESTION:
+"""
+
+_PROMPT_SUFFIX = """
+
+Please provide advisory guidance based on the analysis above. Remember:
+- You are advisory only
+- You cannot change risk levels or policy decisions
+- Base your response on the deterministic facts provided
+- If you need more information, state that clearly
+"""
+
+
+def _format_blast_summary(risk_level: str, affected_count: int, affected_components: List[str]) -> str:
+    return f"""
+Blast Radius Summary:
+- Risk Level: {risk_level}
+- Blast Radius Score: {affected_count} resources affected
+- Affected Components: {', '.join(affected_components) if affected_components else 'None'}
+"""
+
+
+def _format_recommendations(recommendations: List[str]) -> str:
+    return "\n".join(f"- {rec}" for rec in recommendations) if recommendations else "None"
+
 
 @dataclass
 class PromptContract:
     """
     Prompt Contract v1 - defines what AI receives.
-    
+
     This contract ensures:
     - AI only sees deterministic CoreOutput data
     - AI cannot affect risk, policy, or enforcement
@@ -23,85 +68,74 @@ class PromptContract:
     blast_radius_summary: str
     affected_count: int
     affected_components: List[str]
-    
+
+    def __post_init__(self):
+        # All prompt sections except the question are fixed for a given
+        # contract, so assemble them once and reuse across questions.
+        self._static_prefix = _PROMPT_TEMPLATE.format(
+            blast_summary=_format_blast_summary(
+                self.risk_level, self.affected_count, self.affected_components
+            ),
+            explanation_id=self.explanation_id,
+            explanation_text=self.explanation_text,
+            recs_text=_format_recommendations(self.recommendations),
+        )
+        self._static_suffix = _PROMPT_SUFFIX
+
     def to_prompt_text(self, question: str) -> str:
         """
         Build prompt text from contract.
-        
+
         Args:
             question: User's question
-            
+
         Returns:
             Complete prompt text for LLM
         """
-        # Build blast radius summary
-        blast_summary = f"""
-Blast Radius Summary:
-- Risk Level: {self.risk_level}
-- Blast Radius Score: {self.affected_count} resources affected
-- Affected Components: {', '.join(self.affected_components) if self.affected_components else 'None'}
-"""
-        
-        # Build recommendations section
-        recs_text = "\n".join(f"- {rec}" for rec in self.recommendations) if self.recommendations else "None"
-        
-        # Build full prompt with explicit constraints
-        prompt = f"""You are an AI advisor for PreApply, an infrastructure risk analysis tool.
-
-CRITICAL CONSTRAINTS (NON-NEGOTIABLE):
-- You are NOT allowed to change risk levels, scores, policy decisions, or enforcement outcomes.
-- You are providing ADVISORY information only.
-- All risk facts come from the deterministic analysis below.
-- You cannot override or modify the analysis results.
+        return self._static_prefix + question + self._static_suffix
 
-DETERMINISTIC ANALYSIS RESULTS:
-{blast_summary}
+    @staticmethod
+    def to_prompt_text_from_core(core_output: CoreOutput, question: str) -> str:
+        """Build prompt text directly from CoreOutput (no contract instance)."""
+        return _prompt_prefix_from_core(core_output) + question + _PROMPT_SUFFIX
 
-Explanation ID: {self.explanation_id}
-
-Deterministic Explanation:
-{self.explanation_text}
 
-Recommendations:
-{recs_text}
+def _prompt_prefix_from_core(core_output: CoreOutput) -> str:
+    """Format the static prompt prefix from CoreOutput fields."""
+    explanation_text, explanation_id = explain_overall_with_id(core_output)
+    return _PROMPT_TEMPLATE.format(
+        blast_summary=_format_blast_summary(
+            str(core_output.risk_level),
+            core_output.affected_count,
+            core_output.affected_components,
+        ),
+        explanation_id=str(explanation_id.value if hasattr(explanation_id, 'value') else explanation_id),
+        explanation_text=explanation_text,
+        recs_text=_format_recommendations(core_output.recommendations),
+    )
 
-USER QUESTION:
-{question}
 
-Please provide advisory guidance based on the analysis above. Remember:
-- You are advisory only
-- You cannot change risk levels or policy decisions
-- Base your response on the deterministic facts provided
-- If you need more information, state that clearly
-"""
-        return prompt
+# Last (core_output, prefix) pair: interactive sessions ask several questions
+# about the same analysis, so the prefix is rebuilt only when the CoreOutput
+# instance changes.
+_prompt_cache = None
 
 
 def build_prompt(core_output: CoreOutput, question: str) -> str:
     """
     Build prompt from CoreOutput (deterministic).
-    
+
     This function is deterministic: same CoreOutput + same question = same prompt.
-    
+
     Args:
         core_output: CoreOutput from analysis
         question: User's question
-        
+
     Returns:
         Prompt text for LLM
     """
-    # Get deterministic explanation
-    explanation_text, explanation_id = explain_overall_with_id(core_output)
-    
-    # Build prompt contract
-    contract = PromptContract(
-        risk_level=str(core_output.risk_level),
-        explanation_id=str(explanation_id.value if hasattr(explanation_id, 'value') else explanation_id),
-        explanation_text=explanation_text,
-        recommendations=core_output.recommendations,
-        blast_radius_summary=f"{core_output.affected_count} resources affected, score: {core_output.blast_radius_score}",
-        affected_count=core_output.affected_count,
-        affected_components=core_output.affected_components
-    )
-    
-    return contract.to_prompt_text(question)
+    global _prompt_cache
+    if _prompt_cache is None or _prompt_cache[0] is not core_output:
+        _prompt_cache = (core_output, _prompt_prefix_from_core(core_output))
+
+    return _prompt_cache[1] + question + _PROMPT_SUFFIX
@@ -0,0 +1,18 @@
+"""Shared helpers for parsing Terraform resource addresses."""
+
+_SKIP_SEGMENTS = frozenset(("module", "aws", "azurerm", "google"))
+
+
+def parse_resource_type(address: str) -> str:
+    """Extract resource type from Terraform address.
+
+    Walks dot-delimited segments with str.partition, which short-circuits at
+    the first match and avoids allocating a full split list per address
+    (e.g. "module.net.aws_security_group.main" -> "aws_security_group").
+    """
+    rest = address
+    while rest:
+        head, _, rest = rest.partition(".")
+        if "_" in head and head not in _SKIP_SEGMENTS:
+            return head
+    return ""
@@ -21,23 +21,21 @@ def calculate_blast_radius(
         }
     
     changed_node_ids = {graph.get_node_id(r) for r in changed_resources}
-    affected_node_ids = set()
-    
-    for changed_node_id in changed_node_ids:
-        downstream = graph.get_downstream_resources(changed_node_id)
-        affected_node_ids.update(downstream)
-        affected_node_ids.add(changed_node_id)
-    
+    affected_node_ids = graph.get_downstream_closure(changed_node_ids)
+
     affected_components = []
+    seen_components = set()
     component_to_resources = {}
+    component_of = graph.node_component
+    resource_id_of = graph.node_resource_id
     for node_id in affected_node_ids:
-        resource = graph.get_resource(node_id)
-        if resource:
-            component = resource.module if resource.module else resource.type
-            if component not in affected_components:
+        component = component_of.get(node_id)
+        if component is not None:
+            if component not in seen_components:
+                seen_components.add(component)
                 affected_components.append(component)
                 component_to_resources[component] = []
-            component_to_resources[component].append(resource.id)
+            component_to_resources[component].append(resource_id_of[node_id])
     
     result = {
         "affected_count": len(affected_node_ids),
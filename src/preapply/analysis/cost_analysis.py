@@ -1,19 +1,46 @@
 """Detect cost spikes and resource scaling in Terraform plan."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, NamedTuple, Optional
+from ._address_utils import parse_resource_type
 from ..contracts.risk_attributes import CostAlert
 from ..utils.logging import get_logger
 
 logger = get_logger("analysis.cost_analysis")
 
 
-def _parse_resource_type(address: str) -> str:
-    """Extract resource type from Terraform address."""
-    parts = address.split(".")
-    for p in parts:
-        if "_" in p and p not in ("module", "aws", "azurerm", "google"):
-            return p
-    return ""
+class _FrozenCostConfig(NamedTuple):
+    """Pre-built frozensets from the cost_alerts config section."""
+    high_cost_types: frozenset
+    high_cost_instance_types: frozenset
+    low_tier: frozenset
+    high_tier: frozenset
+
+
+# Last (config, frozen) pair: batch callers reuse one config dict across
+# plans, so the sets are rebuilt only when a different config is passed.
+_frozen_cache = None
+
+
+def _freeze_cost_config(config: Dict[str, Any]) -> _FrozenCostConfig:
+    """Freeze config-derived sets, cached per config dict identity."""
+    global _frozen_cache
+    if _frozen_cache is not None and _frozen_cache[0] is config:
+        return _frozen_cache[1]
+
+    cost_config = config.get("cost_alerts", {})
+    tiers = cost_config.get("instance_cost_tiers", {})
+    frozen = _FrozenCostConfig(
+        high_cost_types=frozenset(cost_config.get("high_cost_types", [])),
+        high_cost_instance_types=frozenset(cost_config.get("high_cost_instance_types", [])),
+        low_tier=frozenset(tiers.get("low", [])),
+        high_tier=frozenset(tiers.get("high", [])),
+    )
+    _frozen_cache = (config, frozen)
+    return frozen
+
+_INSTANCE_TYPE_RESOURCES = frozenset({"aws_instance", "aws_db_instance", "aws_launch_template"})
+
+_INTERESTING_ACTIONS = frozenset(("create", "update", "replace"))
 
 
 def detect_cost_alerts(plan_data: Dict[str, Any], config: Dict[str, Any]) -> List[CostAlert]:
@@ -33,15 +60,23 @@ def detect_cost_alerts(plan_data: Dict[str, Any], config: Dict[str, Any]) -> Lis
         List of CostAlert objects
     """
     alerts: List[CostAlert] = []
-    cost_config = config.get("cost_alerts", {})
-    high_cost_types = set(cost_config.get("high_cost_types", []))
-    high_cost_instance_types = set(cost_config.get("high_cost_instance_types", []))
-    tiers = cost_config.get("instance_cost_tiers", {})
-    low_tier = set(tiers.get("low", []))
-    high_tier = set(tiers.get("high", []))
+    frozen = _freeze_cost_config(config)
+    high_cost_types = frozen.high_cost_types
+    high_cost_instance_types = frozen.high_cost_instance_types
+    low_tier = frozen.low_tier
+    high_tier = frozen.high_tier
+
+    # Without any configured cost types or tiers no branch can fire; skip the
+    # full scan instead of rejecting every row individually.
+    if not (high_cost_types or high_cost_instance_types or (low_tier and high_tier)):
+        return alerts
 
     resource_changes = plan_data.get("resource_changes", [])
 
+    # Hoist hot-loop bindings: one pass over resource_changes with local names.
+    _parse = parse_resource_type
+    _append = alerts.append
+
     for rc in resource_changes:
         if not isinstance(rc, dict):
             continue
@@ -50,17 +85,22 @@ def detect_cost_alerts(plan_data: Dict[str, Any], config: Dict[str, Any]) -> Lis
         if not change:
             continue
 
-        resource_type = _parse_resource_type(address)
+        # Most rows carry no create/update/replace action; skip them before
+        # paying for address parsing.
+        actions = change.get("actions", ())
+        if not any(a in _INTERESTING_ACTIONS for a in actions):
+            continue
+
+        resource_type = _parse(address)
         if not resource_type:
             continue
 
-        actions = change.get("actions", [])
         before = change.get("before") or {}
         after = change.get("after") or {}
 
         # High-cost type creation
         if "create" in actions and resource_type in high_cost_types:
-            alerts.append(CostAlert(
+            _append(CostAlert(
                 resource_id=address,
                 resource_type=resource_type,
                 reason="high_cost_creation",
@@ -68,12 +108,12 @@ def detect_cost_alerts(plan_data: Dict[str, Any], config: Dict[str, Any]) -> Lis
             ))
 
         # Instance type checks (aws_instance, aws_db_instance, etc.)
-        if resource_type in ("aws_instance", "aws_db_instance", "aws_launch_template"):
+        if resource_type in _INSTANCE_TYPE_RESOURCES:
             instance_type_before = (before.get("instance_type") or "").strip()
             instance_type_after = (after.get("instance_type") or "").strip()
 
             if "create" in actions and instance_type_after in high_cost_instance_types:
-                alerts.append(CostAlert(
+                _append(CostAlert(
                     resource_id=address,
                     resource_type=resource_type,
                     reason="high_cost_creation",
@@ -82,14 +122,14 @@ def detect_cost_alerts(plan_data: Dict[str, Any], config: Dict[str, Any]) -> Lis
             elif "update" in actions or "replace" in actions:
                 # Scaling: low -> high tier
                 if instance_type_before in low_tier and instance_type_after in high_tier:
-                    alerts.append(CostAlert(
+                    _append(CostAlert(
                         resource_id=address,
                         resource_type=resource_type,
                         reason=f"instance_scaling ({instance_type_before} -> {instance_type_after})",
                         alert_type="INSTANCE_SCALING"
                     ))
                 elif instance_type_after in high_cost_instance_types and instance_type_before != instance_type_after:
-                    alerts.append(CostAlert(
+                    _append(CostAlert(
                         resource_id=address,
                         resource_type=resource_type,
                         reason=f"instance_scaling ({instance_type_before or 'unknown'} -> {instance_type_after})",
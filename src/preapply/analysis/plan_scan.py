@@ -0,0 +1,68 @@
+"""Single-pass scan of resource_changes for security and state-destructive checks."""
+
+from typing import Dict, Any, List, Tuple
+from ._address_utils import parse_resource_type
+from .security_exposure import (
+    _check_security_group_rules,
+    _check_security_group_rule_resource,
+    _check_s3_public_access,
+)
+from .state_destructive import _is_destructive_update
+from ..contracts.risk_attributes import SecurityExposure
+from ..utils.logging import get_logger
+
+logger = get_logger("analysis.plan_scan")
+
+
+def scan_plan(plan_data: Dict[str, Any]) -> Tuple[List[SecurityExposure], List[Dict[str, Any]]]:
+    """
+    Detect security exposures and state-destructive updates in one traversal.
+
+    The two detectors used to iterate resource_changes independently,
+    re-validating each row and re-parsing its address; fusing them halves
+    the dict-walking overhead on the hot analysis path while reusing the
+    same per-resource check helpers.
+
+    Args:
+        plan_data: Raw Terraform plan JSON dictionary
+
+    Returns:
+        (security exposures, state-destructive update dicts)
+    """
+    exposures: List[SecurityExposure] = []
+    destructive: List[Dict[str, Any]] = []
+
+    for rc in plan_data.get("resource_changes", []):
+        if not isinstance(rc, dict):
+            continue
+        address = rc.get("address", "")
+        change = rc.get("change", {})
+        if not change:
+            continue
+
+        resource_type = parse_resource_type(address)
+
+        if resource_type == "aws_security_group":
+            exposures.extend(_check_security_group_rules(address, resource_type, change))
+        elif resource_type in ("aws_vpc_security_group_ingress_rule", "aws_vpc_security_group_egress_rule"):
+            exposures.extend(_check_security_group_rule_resource(address, resource_type, change))
+        elif resource_type in ("aws_s3_bucket_public_access_block", "aws_s3_bucket"):
+            exposures.extend(_check_s3_public_access(address, resource_type, change))
+
+        actions = change.get("actions", [])
+        if "update" in actions or "create" in actions:
+            before = change.get("before") or {}
+            after = change.get("after") or {}
+            if not isinstance(before, dict):
+                before = {}
+            if not isinstance(after, dict):
+                after = {}
+            if _is_destructive_update(before, after):
+                destructive.append({"resource_address": address, "resource_type": resource_type})
+                logger.debug("State-destructive update detected: %s", address)
+
+    if exposures:
+        logger.info(f"Detected {len(exposures)} security exposure(s)")
+    if destructive:
+        logger.info(f"Detected {len(destructive)} state-destructive update(s)")
+    return exposures, destructive
@@ -4,7 +4,6 @@ from typing import List, Dict, Any
 from ..ingest.models import NormalizedResource, ResourceAction
 from ..graph.dependency_graph import DependencyGraph
 from .shared_resources import detect_shared_resources, get_shared_resource_usage
-from .blast_radius import calculate_blast_radius
 from ..utils.logging import get_logger
 
 logger = get_logger("analysis.recommendations")
@@ -16,11 +15,22 @@ def generate_recommendations(
     config: Dict[str, Any]
 ) -> List[str]:
     """Generate deterministic recommendations based on detected patterns."""
-    recommendations = []
     changed_resources = graph.get_changed_resources()
-    
-    shared_resources = detect_shared_resources(graph, config)
-    changed_shared = [r for r in changed_resources if r in shared_resources]
+    if not changed_resources:
+        logger.info("Generated 0 recommendations")
+        return []
+
+    recommendations = []
+
+    # calculate_risk_score already computed these; only recompute when called
+    # with a risk_score dict that doesn't carry them.
+    shared_resources = risk_score.get("shared_resources")
+    if shared_resources is None:
+        shared_resources = detect_shared_resources(graph, config)
+    # Both lists hold the same objects from the graph's resource map, so
+    # identity-based membership gives O(1) lookups (the models are unhashable).
+    _shared_ids = {id(r) for r in shared_resources}
+    changed_shared = [r for r in changed_resources if id(r) in _shared_ids]
     
     if changed_shared:
         for shared in changed_shared:
@@ -29,7 +39,7 @@ def generate_recommendations(
                 rec = f"Isolate {shared.type} resource - currently shared across {len(usage)} modules"
                 recommendations.append(rec)
     
-    critical_types = config.get("shared_resources", {}).get("critical_types", [])
+    critical_types = frozenset(config.get("shared_resources", {}).get("critical_types", ()))
     deletes_on_critical = [
         r for r in changed_resources
         if r.action == ResourceAction.DELETE and r.type in critical_types
@@ -40,18 +50,13 @@ def generate_recommendations(
             rec = f"High risk: Delete action on critical resource {resource.type}"
             recommendations.append(rec)
     
-    blast_radius = calculate_blast_radius(graph, changed_resources)
-    if blast_radius["affected_count"] > 10:
-        rec = f"Large blast radius: {blast_radius['affected_count']} resources affected. Consider breaking into smaller changes."
+    affected_count = risk_score.get("affected_count", 0)
+    if affected_count > 10:
+        rec = f"Large blast radius: {affected_count} resources affected. Consider breaking into smaller changes."
         recommendations.append(rec)
     
-    modules_affected = set()
-    for resource in changed_resources:
-        if resource.module:
-            modules_affected.add(resource.module)
-        else:
-            modules_affected.add("root")
-    
+    modules_affected = {r.module or "root" for r in changed_resources}
+
     if len(modules_affected) > 1:
         rec = f"Cross-module change detected affecting {len(modules_affected)} modules. Review module boundaries."
         recommendations.append(rec)
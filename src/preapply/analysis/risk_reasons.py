@@ -1,9 +1,62 @@
 """Generate deterministic risk reasons during analysis (not presentation)."""
 
-from typing import Optional
+import functools
+import re
+from typing import Callable, Optional, Tuple
 from ..ingest.models import NormalizedResource
 
+# Dispatch table compiled once at import: first matching pattern wins, so the
+# ordering below preserves the original cascade (e.g. vpc before gateway).
+_REASON_RULES: Tuple[Tuple[re.Pattern, Callable[[int, bool, bool], str]], ...] = (
+    (
+        re.compile(r"vpc"),
+        lambda dependents, is_shared, is_critical: (
+            "Broad blast radius across networking layer"
+            if dependents >= 5
+            else "Core networking infrastructure"
+        ),
+    ),
+    (
+        re.compile(r"nat|(?=.*gateway)(?=.*internet)"),
+        lambda dependents, is_shared, is_critical: "Internet egress for private workloads",
+    ),
+    (
+        re.compile(r"subnet"),
+        lambda dependents, is_shared, is_critical: "Network segmentation boundary",
+    ),
+    (
+        re.compile(r"lb|alb|nlb|elb"),
+        lambda dependents, is_shared, is_critical: (
+            "Impacts multiple load-balanced services" if is_shared else "Traffic routing point"
+        ),
+    ),
+    (
+        re.compile(r"security_group|firewall"),
+        lambda dependents, is_shared, is_critical: (
+            "Shared security boundary" if is_shared else "Access control enforcement"
+        ),
+    ),
+    (
+        re.compile(r"db_instance|database"),
+        lambda dependents, is_shared, is_critical: "Data persistence - deletion causes data loss",
+    ),
+    (
+        re.compile(r"s3_bucket"),
+        lambda dependents, is_shared, is_critical: "Object storage - deletion causes data loss",
+    ),
+)
 
+_CRITICAL_REASON_RULES: Tuple[Tuple[re.Pattern, str], ...] = (
+    (re.compile(r"vpc"), "Core networking infrastructure"),
+    (re.compile(r"nat|gateway"), "Internet egress for private workloads"),
+    (re.compile(r"lb|alb|nlb|elb"), "Traffic routing point"),
+    (re.compile(r"security_group|firewall"), "Access control enforcement"),
+    (re.compile(r"db_instance|database"), "Data persistence - deletion causes data loss"),
+    (re.compile(r"s3_bucket"), "Object storage - deletion causes data loss"),
+)
+
+
+@functools.lru_cache(maxsize=512)
 def generate_risk_reason(
     resource_type: str,
     dependents: int,
@@ -12,68 +65,30 @@ def generate_risk_reason(
 ) -> str:
     """Generate deterministic risk reason based on resource characteristics."""
     resource_type_lower = resource_type.lower()
-    
-    if "vpc" in resource_type_lower:
-        if dependents >= 5:
-            return "Broad blast radius across networking layer"
-        return "Core networking infrastructure"
-    
-    if "nat" in resource_type_lower or ("gateway" in resource_type_lower and "internet" in resource_type_lower):
-        return "Internet egress for private workloads"
-    
-    if "nat_gateway" in resource_type_lower:
-        return "Internet egress for private workloads"
-    
-    if "subnet" in resource_type_lower:
-        return "Network segmentation boundary"
-    
-    if any(x in resource_type_lower for x in ["lb", "alb", "nlb", "elb"]):
-        if is_shared:
-            return "Impacts multiple load-balanced services"
-        return "Traffic routing point"
-    
-    if "security_group" in resource_type_lower or "firewall" in resource_type_lower:
-        if is_shared:
-            return "Shared security boundary"
-        return "Access control enforcement"
 
-    if "db_instance" in resource_type_lower or "database" in resource_type_lower:
-        return "Data persistence - deletion causes data loss"
-    if "s3_bucket" in resource_type_lower:
-        return "Object storage - deletion causes data loss"
-    
+    for pattern, handler in _REASON_RULES:
+        if pattern.search(resource_type_lower):
+            return handler(dependents, is_shared, is_critical)
+
     if is_shared and dependents >= 3:
         return f"Shared resource with {dependents} dependents"
-    
+
     if is_critical:
         return "Critical infrastructure component"
-    
+
     if is_shared:
         return f"Shared resource affecting {dependents} dependents"
-    
+
     return "Infrastructure component change"
 
 
+@functools.lru_cache(maxsize=256)
 def generate_critical_risk_reason(resource_type: str) -> str:
     """Generate risk reason for critical infrastructure (non-shared)."""
     resource_type_lower = resource_type.lower()
-    
-    if "vpc" in resource_type_lower:
-        return "Core networking infrastructure"
-    
-    if "nat" in resource_type_lower or "gateway" in resource_type_lower:
-        return "Internet egress for private workloads"
-    
-    if any(x in resource_type_lower for x in ["lb", "alb", "nlb", "elb"]):
-        return "Traffic routing point"
-    
-    if "security_group" in resource_type_lower or "firewall" in resource_type_lower:
-        return "Access control enforcement"
 
-    if "db_instance" in resource_type_lower or "database" in resource_type_lower:
-        return "Data persistence - deletion causes data loss"
-    if "s3_bucket" in resource_type_lower:
-        return "Object storage - deletion causes data loss"
+    for pattern, reason in _CRITICAL_REASON_RULES:
+        if pattern.search(resource_type_lower):
+            return reason
 
     return "Critical infrastructure component"
-
@@ -1,8 +1,10 @@
 """Production-grade multi-dimensional risk scoring (deterministic)."""
 
 import math
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, FrozenSet, List, Tuple, Optional
 from ..ingest.models import NormalizedResource, ResourceAction
 from ..graph.dependency_graph import DependencyGraph
 from .shared_resources import detect_shared_resources
@@ -20,8 +22,16 @@ from ..contracts.risk_attributes import (
 )
 from ..utils.logging import get_logger
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
 logger = get_logger("analysis.risk_scoring")
 
+# Below this many exposures the NumPy array setup costs more than it saves.
+_NUMPY_MIN_EXPOSURES = 8
+
 DEFAULT_SENSITIVE_PORTS = [22, 3389, 1433, 3306, 5432, 5439, 27017]
 DEFAULT_CRITICAL_TYPES = [
     "aws_lb", "aws_alb", "aws_nlb", "aws_vpc", "aws_subnet",
@@ -33,7 +43,13 @@ DEFAULT_SENSITIVE_DELETE_TYPES = [
 ]
 
 
-@dataclass
+# slots=True turns the ~40 hot-path attribute reads into C-array access and
+# shrinks each instance; the keyword only exists on 3.10+, so it is applied
+# conditionally while the package still supports 3.8.
+_dataclass_kwargs = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_dataclass_kwargs)
 class RiskConfig:
     """All tunables for production scorer (from config or defaults)."""
     data_loss_base: float = 50.0
@@ -71,17 +87,24 @@ class RiskConfig:
     high_severe_threshold: float = 100.0
     high_threshold: float = 70.0
     medium_threshold: float = 40.0
-    sensitive_ports: List[int] = None
-    critical_types: List[str] = None
-    sensitive_delete_types: List[str] = None
+    sensitive_ports: FrozenSet[int] = None
+    critical_types: FrozenSet[str] = None
+    sensitive_delete_types: FrozenSet[str] = None
 
     def __post_init__(self):
-        if self.sensitive_ports is None:
-            self.sensitive_ports = DEFAULT_SENSITIVE_PORTS
-        if self.critical_types is None:
-            self.critical_types = DEFAULT_CRITICAL_TYPES
-        if self.sensitive_delete_types is None:
-            self.sensitive_delete_types = DEFAULT_SENSITIVE_DELETE_TYPES
+        # Normalize to frozensets: these fields are only ever used for
+        # membership tests inside per-resource loops.
+        self.sensitive_ports = frozenset(
+            self.sensitive_ports if self.sensitive_ports is not None else DEFAULT_SENSITIVE_PORTS
+        )
+        self.critical_types = frozenset(
+            self.critical_types if self.critical_types is not None else DEFAULT_CRITICAL_TYPES
+        )
+        self.sensitive_delete_types = frozenset(
+            self.sensitive_delete_types
+            if self.sensitive_delete_types is not None
+            else DEFAULT_SENSITIVE_DELETE_TYPES
+        )
 
 
 class ProductionRiskScorer:
@@ -89,49 +112,129 @@ class ProductionRiskScorer:
 
     def __init__(self, config: RiskConfig = None):
         self.config = config or RiskConfig()
+        cfg = self.config
+        # Ascending cutoffs with their (level, action, approval) rows; score()
+        # resolves the tier with one bisect instead of a six-way if-ladder.
+        self._level_thresholds = (
+            cfg.medium_threshold,
+            cfg.high_threshold,
+            cfg.high_severe_threshold,
+            cfg.critical_threshold,
+            cfg.critical_catastrophic_threshold,
+        )
+        # Below this value no interaction bonus can trigger at all.
+        self._min_interaction_threshold = min(
+            cfg.data_security_threshold[0], cfg.data_security_threshold[1],
+            cfg.infra_security_threshold[0], cfg.infra_security_threshold[1],
+            cfg.data_infra_threshold[0], cfg.data_infra_threshold[1],
+            cfg.cost_infra_threshold[0], cfg.cost_infra_threshold[1],
+            cfg.multi_dimension_threshold,
+        )
+        self._action_multipliers = {
+            "DELETE": cfg.delete_multiplier,
+            "UPDATE": cfg.update_multiplier,
+            "CREATE": cfg.create_multiplier,
+        }
+        self._blast_weights = {
+            "infrastructure": cfg.blast_radius_weight_infrastructure,
+            "security": cfg.blast_radius_weight_security,
+            "data": cfg.blast_radius_weight_data,
+            "cost": cfg.blast_radius_weight_cost,
+        }
+        self._level_table = (
+            ("LOW", "AUTO_APPROVE", "NONE"),
+            ("MEDIUM", "REQUIRE_PEER_REVIEW", "ANY_ENGINEER"),
+            ("HIGH", "REQUIRE_APPROVAL", "SENIOR_ENGINEER or TECH_LEAD"),
+            ("HIGH-SEVERE", "REQUIRE_APPROVAL", "SENIOR_ENGINEER + ARCHITECT"),
+            ("CRITICAL", "SOFT_BLOCK", "VP_ENGINEERING or DIRECTOR"),
+            ("CRITICAL-CATASTROPHIC", "HARD_BLOCK", "VP_ENGINEERING + INCIDENT_REVIEW"),
+        )
+
+    @staticmethod
+    def _geometric_sum(decay: float, count: int) -> float:
+        """Sum of decay**i for i in range(count), in closed form."""
+        if count <= 0:
+            return 0.0
+        if decay == 1.0:
+            return float(count)
+        return (1.0 - decay ** count) / (1.0 - decay)
 
     def calculate_data_loss_dimension(
         self,
         deletions: List[Dict],
         state_destructive_updates: List[Dict],
     ) -> float:
-        """Data loss risk with stacking decay. action_weight: DELETE=1.0, state-destructive=0.6."""
-        score = 0.0
-        for i, _ in enumerate(deletions):
-            decay = self.config.data_loss_decay ** i
-            score += self.config.data_loss_base * decay * 1.0  # action_weight DELETE=1.0
-        for i, _ in enumerate(state_destructive_updates, start=len(deletions)):
-            decay = self.config.data_loss_decay ** i
-            score += self.config.data_loss_base * decay * self.config.state_destructive_multiplier
+        """Data loss risk with stacking decay. action_weight: DELETE=1.0, state-destructive=0.6.
+
+        Both runs are uniform-weight geometric series, so the per-item loop
+        collapses to two closed-form partial sums split at len(deletions).
+        """
+        if not deletions and not state_destructive_updates:
+            return 0.0
+        cfg = self.config
+        base = cfg.data_loss_base
+        decay = cfg.data_loss_decay
+        n_del = len(deletions)
+        n_sd = len(state_destructive_updates)
+
+        score = base * self._geometric_sum(decay, n_del)  # action_weight DELETE=1.0
+        if n_sd:
+            score += (
+                base
+                * cfg.state_destructive_multiplier
+                * decay ** n_del
+                * self._geometric_sum(decay, n_sd)
+            )
         return score
 
     def calculate_security_dimension(self, exposures: List[Dict]) -> float:
-        """Security exposure risk with stacking decay."""
-        score = 0.0
+        """Security exposure risk with stacking decay.
+
+        The base contribution is a closed-form geometric sum; only exposures
+        hitting a sensitive port add their positional decay term on top.
+        """
+        n = len(exposures)
+        if n == 0:
+            return 0.0
+
+        cfg = self.config
+        base = cfg.security_exposure_base
+        decay = cfg.security_exposure_decay
+        penalty = cfg.security_sensitive_port_penalty
+        sensitive_ports = cfg.sensitive_ports
+
+        if _np is not None and n >= _NUMPY_MIN_EXPOSURES:
+            hits = _np.fromiter(
+                (exp.get("port") in sensitive_ports for exp in exposures),
+                dtype=bool,
+                count=n,
+            )
+            bases = base + hits * penalty
+            decays = decay ** _np.arange(n)
+            return float(bases @ decays)
+
+        score = base * self._geometric_sum(decay, n)
         for i, exp in enumerate(exposures):
-            decay = self.config.security_exposure_decay ** i
-            base = self.config.security_exposure_base
-            port_penalty = 0
-            if exp.get("port") is not None and exp["port"] in self.config.sensitive_ports:
-                port_penalty = self.config.security_sensitive_port_penalty
-            score += (base + port_penalty) * decay
+            port = exp.get("port")
+            if port is not None and port in sensitive_ports:
+                score += penalty * decay ** i
         return score
 
     def calculate_infrastructure_dimension(self, shared_resources: List[Dict]) -> float:
         """Infrastructure risk: per-resource action mult (DELETE 2.0, UPDATE 1.5, CREATE 1.0)."""
+        if not shared_resources:
+            return 0.0
+        cfg = self.config
+        base = cfg.infrastructure_shared_base
+        critical_base = base * cfg.infrastructure_critical_mult
+        multipliers = self._action_multipliers
+        create_mult = cfg.create_multiplier
         score = 0.0
         for r in shared_resources:
-            base = self.config.infrastructure_shared_base
-            if r.get("is_critical", False):
-                base *= self.config.infrastructure_critical_mult
-            action = (r.get("action") or "UPDATE").upper()
-            if action == "DELETE":
-                mult = self.config.delete_multiplier
-            elif action == "UPDATE":
-                mult = self.config.update_multiplier
-            else:
-                mult = self.config.create_multiplier
-            score += base * mult
+            b = critical_base if r.get("is_critical", False) else base
+            # Table lookup replaces the per-resource action if-ladder; unknown
+            # actions fall through to the CREATE multiplier as before.
+            score += b * multipliers.get((r.get("action") or "UPDATE").upper(), create_mult)
         return score
 
     def calculate_cost_dimension(
@@ -139,60 +242,62 @@ class ProductionRiskScorer:
         high_cost_creations: int,
         instance_scalings: int,
     ) -> float:
-        """Cost risk with stacking decay."""
-        score = 0.0
-        for i in range(high_cost_creations):
-            decay = self.config.cost_decay ** i
-            score += self.config.cost_creation_weight * decay
-        for i in range(instance_scalings):
-            decay = self.config.cost_decay ** (high_cost_creations + i)
-            score += self.config.cost_scaling_weight * decay
+        """Cost risk with stacking decay (closed-form geometric sums)."""
+        if not high_cost_creations and not instance_scalings:
+            return 0.0
+        cfg = self.config
+        decay = cfg.cost_decay
+        score = cfg.cost_creation_weight * self._geometric_sum(decay, high_cost_creations)
+        if instance_scalings:
+            score += (
+                cfg.cost_scaling_weight
+                * decay ** high_cost_creations
+                * self._geometric_sum(decay, instance_scalings)
+            )
         return score
 
     def calculate_interaction_multiplier(self, dimensions: Dict[str, float]) -> float:
         """Interaction multiplier (1.0 + sum of bonuses)."""
+        data = dimensions.get("data", 0)
+        security = dimensions.get("security", 0)
+        infrastructure = dimensions.get("infrastructure", 0)
+        cost = dimensions.get("cost", 0)
+
+        # Common LOW-risk case: nothing clears the lowest threshold, so no
+        # bonus can fire.
+        if max(data, security, infrastructure, cost) < self._min_interaction_threshold:
+            return 1.0
+
+        cfg = self.config
         bonus = 0.0
-        if (
-            dimensions.get("data", 0) >= self.config.data_security_threshold[0]
-            and dimensions.get("security", 0) >= self.config.data_security_threshold[1]
-        ):
-            bonus += self.config.data_security_bonus
-        if (
-            dimensions.get("infrastructure", 0) >= self.config.infra_security_threshold[0]
-            and dimensions.get("security", 0) >= self.config.infra_security_threshold[1]
-        ):
-            bonus += self.config.infra_security_bonus
-        if (
-            dimensions.get("data", 0) >= self.config.data_infra_threshold[0]
-            and dimensions.get("infrastructure", 0) >= self.config.data_infra_threshold[1]
-        ):
-            bonus += self.config.data_infra_bonus
-        if (
-            dimensions.get("cost", 0) >= self.config.cost_infra_threshold[0]
-            and dimensions.get("infrastructure", 0) >= self.config.cost_infra_threshold[1]
-        ):
-            bonus += self.config.cost_infra_bonus
-        elevated_count = sum(
-            1 for s in dimensions.values() if s >= self.config.multi_dimension_threshold
-        )
+        if data >= cfg.data_security_threshold[0] and security >= cfg.data_security_threshold[1]:
+            bonus += cfg.data_security_bonus
+        if infrastructure >= cfg.infra_security_threshold[0] and security >= cfg.infra_security_threshold[1]:
+            bonus += cfg.infra_security_bonus
+        if data >= cfg.data_infra_threshold[0] and infrastructure >= cfg.data_infra_threshold[1]:
+            bonus += cfg.data_infra_bonus
+        if cost >= cfg.cost_infra_threshold[0] and infrastructure >= cfg.cost_infra_threshold[1]:
+            bonus += cfg.cost_infra_bonus
+
+        t = cfg.multi_dimension_threshold
+        elevated_count = (data >= t) + (security >= t) + (infrastructure >= t) + (cost >= t)
         if elevated_count >= 3:
-            bonus += self.config.three_dimension_bonus
+            bonus += cfg.three_dimension_bonus
         elif elevated_count == 2:
-            bonus += self.config.two_dimension_bonus
+            bonus += cfg.two_dimension_bonus
         return 1.0 + bonus
 
     def calculate_blast_radius(self, affected_count: int, primary_dimension: str) -> float:
         """B × ω_context."""
         if affected_count == 0:
             return 0.0
-        b = self.config.blast_radius_base_multiplier * math.log2(affected_count + 1)
-        weights = {
-            "infrastructure": self.config.blast_radius_weight_infrastructure,
-            "security": self.config.blast_radius_weight_security,
-            "data": self.config.blast_radius_weight_data,
-            "cost": self.config.blast_radius_weight_cost,
-        }
-        w = weights.get(primary_dimension, 0.5)
+        if affected_count == 1:
+            # log2(2) == 1.0 exactly; skip the libm call for the common
+            # single-resource case.
+            b = self.config.blast_radius_base_multiplier
+        else:
+            b = self.config.blast_radius_base_multiplier * math.log2(affected_count + 1)
+        w = self._blast_weights.get(primary_dimension, 0.5)
         return b * w
 
     def score(
@@ -206,59 +311,92 @@ class ProductionRiskScorer:
         affected_count: int,
     ) -> Dict[str, Any]:
         """Full orchestration: dimensions, interaction, blast, level, action."""
+        d_data = self.calculate_data_loss_dimension(deletions, state_destructive_updates)
+        d_security = self.calculate_security_dimension(exposures)
+        d_infrastructure = self.calculate_infrastructure_dimension(shared_resources)
+        d_cost = self.calculate_cost_dimension(high_cost_creations, instance_scalings)
         dimensions = {
-            "data": self.calculate_data_loss_dimension(deletions, state_destructive_updates),
-            "security": self.calculate_security_dimension(exposures),
-            "infrastructure": self.calculate_infrastructure_dimension(shared_resources),
-            "cost": self.calculate_cost_dimension(high_cost_creations, instance_scalings),
+            "data": d_data,
+            "security": d_security,
+            "infrastructure": d_infrastructure,
+            "cost": d_cost,
         }
-        primary_dimension = max(dimensions, key=dimensions.get)
-        primary_score = dimensions[primary_dimension]
+        # Unrolled max over exactly four values; strict > keeps the same
+        # first-wins tie-breaking as max(dimensions, key=dimensions.get).
+        primary_dimension, primary_score = "data", d_data
+        if d_security > primary_score:
+            primary_dimension, primary_score = "security", d_security
+        if d_infrastructure > primary_score:
+            primary_dimension, primary_score = "infrastructure", d_infrastructure
+        if d_cost > primary_score:
+            primary_dimension, primary_score = "cost", d_cost
         interaction_mult = self.calculate_interaction_multiplier(dimensions)
         blast_contribution = self.calculate_blast_radius(affected_count, primary_dimension)
         final_score = (primary_score * interaction_mult) + blast_contribution
 
-        if final_score >= self.config.critical_catastrophic_threshold:
-            level = "CRITICAL-CATASTROPHIC"
-            action = "HARD_BLOCK"
-            approval = "VP_ENGINEERING + INCIDENT_REVIEW"
-        elif final_score >= self.config.critical_threshold:
-            level = "CRITICAL"
-            action = "SOFT_BLOCK"
-            approval = "VP_ENGINEERING or DIRECTOR"
-        elif final_score >= self.config.high_severe_threshold:
-            level = "HIGH-SEVERE"
-            action = "REQUIRE_APPROVAL"
-            approval = "SENIOR_ENGINEER + ARCHITECT"
-        elif final_score >= self.config.high_threshold:
-            level = "HIGH"
-            action = "REQUIRE_APPROVAL"
-            approval = "SENIOR_ENGINEER or TECH_LEAD"
-        elif final_score >= self.config.medium_threshold:
-            level = "MEDIUM"
-            action = "REQUIRE_PEER_REVIEW"
-            approval = "ANY_ENGINEER"
-        else:
-            level = "LOW"
-            action = "AUTO_APPROVE"
-            approval = "NONE"
+        level, action, approval = self._level_table[
+            bisect_right(self._level_thresholds, final_score)
+        ]
 
+        # Raw floats: rounding is display formatting and happens once at the
+        # calculate_risk_score boundary (see _round_result), not per score call.
         return {
-            "score": round(final_score, 2),
+            "score": final_score,
             "level": level,
             "action": action,
             "approval_required": approval,
             "primary_dimension": primary_dimension,
-            "dimensions": {k: round(v, 2) for k, v in dimensions.items()},
+            "dimensions": dimensions,
             "breakdown": {
-                "primary_score": round(primary_score, 2),
-                "interaction_multiplier": round(interaction_mult, 3),
-                "blast_radius_contribution": round(blast_contribution, 2),
+                "primary_score": primary_score,
+                "interaction_multiplier": interaction_mult,
+                "blast_radius_contribution": blast_contribution,
                 "affected_resources": affected_count,
             },
         }
 
 
+# Last (config, RiskConfig) pair: CLI/batch callers pass the same config dict
+# for every plan, so the ~30 nested get/float conversions run once per config.
+_risk_config_cache = None
+
+
+def _get_risk_config(config: Dict[str, Any]) -> RiskConfig:
+    """Build RiskConfig from config, cached per config dict identity."""
+    global _risk_config_cache
+    if _risk_config_cache is not None and _risk_config_cache[0] is config:
+        return _risk_config_cache[1]
+    risk_config = _build_risk_config(config)
+    _risk_config_cache = (config, risk_config)
+    return risk_config
+
+
+def _round_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Round scorer output for emission (same precision as the contract)."""
+    result["score"] = round(result["score"], 2)
+    result["dimensions"] = {k: round(v, 2) for k, v in result["dimensions"].items()}
+    breakdown = result["breakdown"]
+    breakdown["primary_score"] = round(breakdown["primary_score"], 2)
+    breakdown["interaction_multiplier"] = round(breakdown["interaction_multiplier"], 3)
+    breakdown["blast_radius_contribution"] = round(breakdown["blast_radius_contribution"], 2)
+    return result
+
+
+# Last (RiskConfig, scorer) pair: the scorer precomputes threshold tables and
+# blast weights in __init__, so batch callers pay that setup once per config.
+_scorer_cache = None
+
+
+def _get_scorer(risk_config: RiskConfig) -> "ProductionRiskScorer":
+    """Get a ProductionRiskScorer, cached per RiskConfig identity."""
+    global _scorer_cache
+    if _scorer_cache is not None and _scorer_cache[0] is risk_config:
+        return _scorer_cache[1]
+    scorer = ProductionRiskScorer(risk_config)
+    _scorer_cache = (risk_config, scorer)
+    return scorer
+
+
 def _build_risk_config(config: Dict[str, Any]) -> RiskConfig:
     """Build RiskConfig from config dict (risk_scoring section or legacy)."""
     rs = config.get("risk_scoring", {})
@@ -354,30 +492,65 @@ def calculate_risk_score(
 
     blast_radius = calculate_blast_radius(graph, changed_resources)
     shared_list = detect_shared_resources(graph, config)
-    changed_shared = [r for r in changed_resources if r in shared_list]
-    risk_config = _build_risk_config(config)
+    risk_config = _get_risk_config(config)
     critical_types = risk_config.critical_types
     sensitive_delete_types = risk_config.sensitive_delete_types
 
-    deletions = [
-        {"type": r.type, "id": r.id if not r.module else f"{r.module}.{r.id}"}
-        for r in changed_resources
-        if r.action == ResourceAction.DELETE and r.type in sensitive_delete_types
-    ]
+    # One fused pass over changed_resources: shared/critical/sensitive
+    # classification, deletion counting, and action tallies together, instead
+    # of a separate traversal per derived list.
+    # NormalizedResource is unhashable (pydantic model), so membership uses an
+    # identity set: both lists reference the same objects out of the graph.
+    _shared_ids = {id(r) for r in shared_list} if shared_list else ()
+    # Enum members are singletons, so identity checks against locals replace
+    # per-iteration enum __eq__ calls and global attribute chains.
+    _DELETE = ResourceAction.DELETE
+    _NO_OP = ResourceAction.NO_OP
+    changed_shared: List[NormalizedResource] = []
+    changed_critical: List[NormalizedResource] = []
+    deletions: List[Dict] = []
+    sensitive_deletions: List[SensitiveDeletion] = []
+    action_values = set()
+    deletion_count = 0
+    for r in changed_resources:
+        action = r.action
+        if action is not _NO_OP:
+            action_values.add(action.value)
+        is_delete = action is _DELETE
+        if is_delete:
+            deletion_count += 1
+        is_shared = id(r) in _shared_ids
+        if is_shared:
+            changed_shared.append(r)
+        elif r.type in critical_types:
+            changed_critical.append(r)
+        if is_delete and r.type in sensitive_delete_types:
+            resource_id = r.address
+            deletions.append({"type": r.type, "id": resource_id})
+            sensitive_deletions.append(
+                SensitiveDeletion(resource_id=resource_id, resource_type=r.type)
+            )
 
     exposures_for_scorer = []
     for exp in security_exposures:
         d = {"port": getattr(exp, "port", None)}
         exposures_for_scorer.append(d)
 
-    shared_resources_for_scorer = []
+    # Resolve node id and dependents count once per shared resource; both the
+    # scorer input and the SharedDependency builder below need them. The node
+    # id is the fully-qualified resource id, so it doubles as resource_id.
+    shared_meta = []
     for r in changed_shared:
         node_id = graph.get_node_id(r)
+        shared_meta.append((r, node_id, len(graph.get_downstream_resources(node_id))))
+
+    shared_resources_for_scorer = []
+    for r, _node_id, dep_count in shared_meta:
         shared_resources_for_scorer.append({
             "type": r.type,
-            "action": r.action.value if hasattr(r.action, "value") else str(r.action),
+            "action": r.action.value if isinstance(r.action, ResourceAction) else str(r.action),
             "is_critical": r.type in critical_types,
-            "dependents": len(graph.get_downstream_resources(node_id)),
+            "dependents": dep_count,
         })
 
     def _alert_type(a) -> str:
@@ -386,13 +559,19 @@ def calculate_risk_score(
             return at
         return "INSTANCE_SCALING" if "scaling" in getattr(a, "reason", "").lower() else "HIGH_COST_CREATION"
 
-    high_cost_creations = len([a for a in cost_alerts if _alert_type(a) == "HIGH_COST_CREATION"])
-    instance_scalings = len([a for a in cost_alerts if _alert_type(a) == "INSTANCE_SCALING"])
+    high_cost_creations = 0
+    instance_scalings = 0
+    for a in cost_alerts:
+        alert_type = _alert_type(a)
+        if alert_type == "HIGH_COST_CREATION":
+            high_cost_creations += 1
+        elif alert_type == "INSTANCE_SCALING":
+            instance_scalings += 1
 
     affected_count = blast_radius["affected_count"]
 
-    scorer = ProductionRiskScorer(risk_config)
-    result = scorer.score(
+    scorer = _get_scorer(risk_config)
+    result = _round_result(scorer.score(
         deletions=deletions,
         state_destructive_updates=state_destructive_updates,
         exposures=exposures_for_scorer,
@@ -400,66 +579,53 @@ def calculate_risk_score(
         high_cost_creations=high_cost_creations,
         instance_scalings=instance_scalings,
         affected_count=affected_count,
-    )
+    ))
 
     from ..contracts.core_output import get_legacy_risk_level
     legacy_level = get_legacy_risk_level(result["level"])
 
+    # Hot-loop bindings for plans with many shared resources.
     shared_dependencies: List[SharedDependency] = []
-    for r in changed_shared:
-        node_id = graph.get_node_id(r)
-        dep_count = len(graph.get_downstream_resources(node_id))
-        resource_id = r.id if not r.module else f"{r.module}.{r.id}"
-        risk_reason = generate_risk_reason(
+    _append_shared = shared_dependencies.append
+    _gen_reason = generate_risk_reason
+    _crit_mult = risk_config.infrastructure_critical_mult
+    for r, resource_id, dep_count in shared_meta:
+        is_critical = r.type in critical_types
+        risk_reason = _gen_reason(
             resource_type=r.type,
             dependents=dep_count,
             is_shared=True,
-            is_critical=r.type in critical_types,
+            is_critical=is_critical,
         )
-        shared_dependencies.append(SharedDependency(
+        _append_shared(SharedDependency(
             resource_id=resource_id,
             resource_type=r.type,
             dependents=dep_count,
-            is_critical=r.type in critical_types,
-            multiplier_applied=risk_config.infrastructure_critical_mult if r.type in critical_types else None,
+            is_critical=is_critical,
+            multiplier_applied=_crit_mult if is_critical else None,
             risk_reason=risk_reason,
         ))
 
     critical_infrastructure: List[CriticalInfrastructure] = []
-    changed_critical = [
-        r for r in changed_resources
-        if r.type in critical_types and r not in changed_shared
-    ]
+    _append_critical = critical_infrastructure.append
+    _gen_critical_reason = generate_critical_risk_reason
     for r in changed_critical:
-        resource_id = r.id if not r.module else f"{r.module}.{r.id}"
-        critical_infrastructure.append(CriticalInfrastructure(
-            resource_id=resource_id,
+        _append_critical(CriticalInfrastructure(
+            resource_id=r.address,
             resource_type=r.type,
-            risk_reason=generate_critical_risk_reason(r.type),
+            risk_reason=_gen_critical_reason(r.type),
         ))
 
-    sensitive_deletions: List[SensitiveDeletion] = []
-    for r in changed_resources:
-        if r.action == ResourceAction.DELETE and r.type in sensitive_delete_types:
-            resource_id = r.id if not r.module else f"{r.module}.{r.id}"
-            sensitive_deletions.append(SensitiveDeletion(resource_id=resource_id, resource_type=r.type))
-
-    action_types = list({r.action.value for r in changed_resources if r.action != ResourceAction.NO_OP})
-    if not action_types:
-        action_types = ["CREATE"]
-
-    factors = []
-    for d in result["dimensions"].values():
-        if d > 0:
-            factors.append(f"Dimension score: {d}")
+    action_types = list(action_values) or ["CREATE"]
+
+    # contributing_factors feeds CoreOutput.risk_factors (still rendered by
+    # the human formatter), so it is built in bulk rather than skipped.
+    factors = [f"Dimension score: {d}" for d in result["dimensions"].values() if d > 0]
     if affected_count > 0:
         factors.append(f"{affected_count} resources affected")
-    for sd in sensitive_deletions:
-        factors.append(f"Sensitive deletion: {sd.resource_id} ({sd.resource_type})")
-    for exp in security_exposures:
-        factors.append(f"Security exposure: {exp.details}")
-    for ca in cost_alerts:
-        factors.append(f"Cost alert: {ca.reason}")
+    factors.extend(f"Sensitive deletion: {sd.resource_id} ({sd.resource_type})" for sd in sensitive_deletions)
+    factors.extend(f"Security exposure: {exp.details}" for exp in security_exposures)
+    factors.extend(f"Cost alert: {ca.reason}" for ca in cost_alerts)
 
     breakdown = result["breakdown"]
     risk_breakdown = RiskBreakdown(
@@ -486,7 +652,6 @@ def calculate_risk_score(
         risk_breakdown=risk_breakdown,
     )
 
-    deletion_count = sum(1 for r in changed_resources if r.action == ResourceAction.DELETE)
 
     logger.info(f"Risk score calculated: {result['score']} ({result['level']})")
 
@@ -501,4 +666,5 @@ def calculate_risk_score(
         "deletion_count": deletion_count,
         "affected_components": blast_radius["affected_components"],
         "risk_attributes": risk_attributes,
+        "shared_resources": shared_list,
     }
@@ -1,5 +1,7 @@
 """Detect security exposures in Terraform plan (public CIDR, S3 public access, port sensitivity)."""
 
+from bisect import bisect_left, bisect_right
+from itertools import chain
 from typing import Dict, Any, List, Optional
 from ..contracts.risk_attributes import SecurityExposure
 from ..utils.logging import get_logger
@@ -9,6 +11,12 @@ logger = get_logger("analysis.security_exposure")
 GLOBAL_CIDRS = ("0.0.0.0/0", "::/0")
 SENSITIVE_PORTS = (22, 3389, 1433, 3306, 5432, 5439, 27017)  # SSH, RDP, MSSQL, MySQL, PostgreSQL, Redshift, MongoDB
 
+# Derived lookup structures: O(1) membership and a sorted list for the
+# range-overlap bisect in _is_port_sensitive.
+_SENSITIVE_SET = frozenset(SENSITIVE_PORTS)
+_SORTED_SENSITIVE = sorted(SENSITIVE_PORTS)
+_GLOBAL_SET = frozenset(GLOBAL_CIDRS)
+
 
 def _get_exposure_port(from_port: Any, to_port: Any) -> Optional[int]:
     """
@@ -24,7 +32,7 @@ def _get_exposure_port(from_port: Any, to_port: Any) -> Optional[int]:
             high = low
         if low == high:
             return low
-        if low in SENSITIVE_PORTS:
+        if low in _SENSITIVE_SET:
             return low
         return None
     except (TypeError, ValueError):
@@ -33,10 +41,10 @@ def _get_exposure_port(from_port: Any, to_port: Any) -> Optional[int]:
 
 def _has_global_cidr(cidr_blocks: List[str], ipv6_blocks: List[str] = None) -> bool:
     """Check if any CIDR is globally open."""
-    ipv6_blocks = ipv6_blocks or []
-    for cidr in (cidr_blocks or []) + ipv6_blocks:
-        cidr = (cidr or "").strip()
-        if cidr in GLOBAL_CIDRS:
+    for cidr in chain(cidr_blocks or (), ipv6_blocks or ()):
+        # Fast path: Terraform emits canonical CIDR strings, so the plain
+        # membership test usually decides without paying for strip().
+        if cidr in _GLOBAL_SET or (cidr and cidr.strip() in _GLOBAL_SET):
             return True
     return False
 
@@ -46,12 +54,12 @@ def _is_port_sensitive(from_port: Any, to_port: Any) -> bool:
     try:
         low = int(from_port) if from_port is not None else 0
         high = int(to_port) if to_port is not None else 65535
-        for p in SENSITIVE_PORTS:
-            if low <= p <= high:
-                return True
+        # Some sensitive port falls in [low, high] iff the bisect window is
+        # non-empty; replaces the linear scan per rule (and stays False for
+        # inverted ranges, where the window collapses).
+        return bisect_left(_SORTED_SENSITIVE, low) < bisect_right(_SORTED_SENSITIVE, high)
     except (TypeError, ValueError):
-        pass
-    return False
+        return False
 
 
 def _check_security_group_rules(address: str, resource_type: str, change: Dict[str, Any]) -> List[SecurityExposure]:
@@ -62,6 +70,10 @@ def _check_security_group_rules(address: str, resource_type: str, change: Dict[s
     if not side:
         return exposures
 
+    # Hot-loop bindings: unbound dict.get skips a bound-method allocation per
+    # rule, and the append local keeps lookups out of the inner loop.
+    rule_get = dict.get
+    _append = exposures.append
     for rule_type in ("ingress", "egress"):
         rules = side.get(rule_type, [])
         if not isinstance(rules, list):
@@ -69,17 +81,17 @@ def _check_security_group_rules(address: str, resource_type: str, change: Dict[s
         for rule in rules:
             if not isinstance(rule, dict):
                 continue
-            cidr_blocks = rule.get("cidr_blocks") or []
-            ipv6_blocks = rule.get("ipv6_cidr_blocks") or []
+            cidr_blocks = rule_get(rule, "cidr_blocks") or []
+            ipv6_blocks = rule_get(rule, "ipv6_cidr_blocks") or []
             if not _has_global_cidr(cidr_blocks, ipv6_blocks):
                 continue
-            from_port = rule.get("from_port")
-            to_port = rule.get("to_port")
+            from_port = rule_get(rule, "from_port")
+            to_port = rule_get(rule, "to_port")
             port_sensitive = _is_port_sensitive(from_port, to_port)
             port_val = _get_exposure_port(from_port, to_port)
             port_desc = f" (Port {port_val} exposed)" if port_val and port_sensitive else (" (sensitive port exposed)" if port_sensitive else "")
             details = f"{rule_type} open to 0.0.0.0/0 or ::/0{port_desc}"
-            exposures.append(SecurityExposure(
+            _append(SecurityExposure(
                 resource_id=address,
                 resource_type=resource_type,
                 exposure_type="public_cidr",
@@ -171,34 +183,8 @@ def detect_security_exposures(plan_data: Dict[str, Any]) -> List[SecurityExposur
     Returns:
         List of SecurityExposure objects
     """
-    exposures: List[SecurityExposure] = []
-    resource_changes = plan_data.get("resource_changes", [])
-
-    for rc in resource_changes:
-        if not isinstance(rc, dict):
-            continue
-        address = rc.get("address", "")
-        change = rc.get("change", {})
-        if not change:
-            continue
-
-        # Infer resource type from address (e.g. "aws_security_group.main" -> aws_security_group)
-        parts = address.split(".")
-        resource_type = ""
-        for p in parts:
-            if "_" in p and p not in ("module", "aws", "azurerm", "google"):
-                resource_type = p
-                break
-        if not resource_type:
-            continue
-
-        if resource_type in ("aws_security_group",):
-            exposures.extend(_check_security_group_rules(address, resource_type, change))
-        elif resource_type in ("aws_vpc_security_group_ingress_rule", "aws_vpc_security_group_egress_rule"):
-            exposures.extend(_check_security_group_rule_resource(address, resource_type, change))
-        elif resource_type in ("aws_s3_bucket_public_access_block", "aws_s3_bucket"):
-            exposures.extend(_check_s3_public_access(address, resource_type, change))
-
-    if exposures:
-        logger.info(f"Detected {len(exposures)} security exposure(s)")
-    return exposures
+    # Thin wrapper over the fused scanner (see plan_scan.scan_plan); callers
+    # that need both detectors should call scan_plan directly to pay for a
+    # single traversal.
+    from .plan_scan import scan_plan
+    return scan_plan(plan_data)[0]
@@ -14,15 +14,18 @@ def detect_shared_resources(
 ) -> List[NormalizedResource]:
     """Detect shared resources: topology-based (2+ dependents)."""
     shared = []
-    all_resources = graph.get_all_resources()
-    
-    for resource in all_resources:
-        node_id = graph.get_node_id(resource)
-        dependents = graph.get_downstream_resources(node_id)
-        
-        if len(dependents) >= 2:
+
+    # graph.nodes is keyed by node id already, so walking items() skips one
+    # get_node_id string format per resource. downstream_counts() fills the
+    # graph's per-node memo in one reverse-topological pass, so risk scoring
+    # re-queries the same sets for free.
+    counts = graph.downstream_counts()
+    for node_id, resource in graph.nodes.items():
+        dependents = counts[node_id]
+
+        if dependents >= 2:
             shared.append(resource)
-            logger.debug(f"Resource {resource.id} is shared ({len(dependents)} dependents)")
+            logger.debug("Resource %s is shared (%d dependents)", resource.id, dependents)
     
     logger.info(f"Detected {len(shared)} shared resources (topology-based)")
     return shared
@@ -37,12 +40,13 @@ def get_shared_resource_usage(
     dependents = graph.get_downstream_resources(node_id)
     
     modules = set()
+    _get = graph.nodes.get
     for dep_node_id in dependents:
-        dep_resource = graph.get_resource(dep_node_id)
+        dep_resource = _get(dep_node_id)
         if dep_resource and dep_resource.module:
             modules.add(dep_resource.module)
         elif dep_resource:
             modules.add("root")
-    
+
     return list(modules)
 
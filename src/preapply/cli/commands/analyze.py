@@ -3,8 +3,8 @@
 import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 import click
-from ...contracts.core_output import CoreOutput
 from ...utils.errors import PreApplyError
 from ...utils.logging import get_logger
 from ..utils import run_analysis, format_error
@@ -12,6 +12,11 @@ from ..utils.file_resolver import resolve_file_path
 
 logger = get_logger("cli.analyze")
 
+# Import contracts lazily: pulling in the pydantic-backed models at module
+# import slows every CLI invocation's cold start, even `--help`.
+if TYPE_CHECKING:
+    from ...contracts.core_output import CoreOutput
+
 
 @click.command()
 @click.argument('plan_json', type=click.Path(exists=False))
@@ -44,6 +49,17 @@ def analyze(plan_json, json, output, quiet, ascii_output):
             click.echo("📊 Building dependency graph and calculating risk...", err=True)
             click.echo("✅ Analysis complete!", err=True)
         
+        # JSON bound for a file is written as bytes straight to disk,
+        # skipping the text-IO encoding layer on large outputs.
+        if json and output:
+            output_path = Path(output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'wb') as f:
+                f.write(analysis_result.model_dump_json(indent=2).encode('utf-8'))
+            if not quiet:
+                click.echo(f"Output saved to: {output_path}", err=True)
+            return
+
         # Format output
         if json:
             output_text = _format_json_output(analysis_result)
@@ -81,7 +97,12 @@ def analyze(plan_json, json, output, quiet, ascii_output):
         sys.exit(1)
 
 
-def _format_json_output(output: CoreOutput) -> str:
-    """Format CoreOutput as JSON string."""
-    return json.dumps(output.model_dump(), indent=2)
+def _format_json_output(output: "CoreOutput") -> str:
+    """Format CoreOutput as JSON string.
+
+    model_dump_json serializes straight from pydantic's Rust core, skipping
+    the intermediate dict that model_dump would materialize only to be
+    re-walked by the encoder.
+    """
+    return output.model_dump_json(indent=2)
 
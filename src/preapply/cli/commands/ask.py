@@ -3,40 +3,93 @@
 import json
 import click
 from pathlib import Path
-from typing import Optional
-from ...contracts.core_output import CoreOutput
+from typing import Optional, TYPE_CHECKING
 from ...utils.errors import PreApplyError
+from ...utils.jsonio import dumps_indented, loads as json_loads
 from ...utils.logging import get_logger
-from ..utils import format_error, run_analysis
+from ..utils import format_error
 from ..utils.file_resolver import resolve_file_path
 
+if TYPE_CHECKING:
+    from ...contracts.core_output import CoreOutput
+
 logger = get_logger("cli.ask")
 
+# Error templates built once at import; the handlers only fill in the filename.
+_ERR_OLLAMA_NOT_RUNNING = (
+    "Ollama is not running. Please start Ollama and try again. "
+    "Visit https://ollama.ai for installation instructions."
+)
+_ERR_NOT_JSON = "The file {path} is not valid JSON."
+_ERR_FILE_NOT_FOUND = (
+    "{error}\n\nYou can use either:\n"
+    "  • A Terraform plan: preapply ask ai \"Your question\" plan.json\n"
+    "  • Or save analysis first: preapply analyze plan.json --json -o analysis.json"
+)
+
+
+# Discriminator keys, checked with one C-level set operation per dict.
+_PLAN_KEYS = frozenset(("resource_changes", "terraform_version"))
+_CORE_KEYS = frozenset(("risk_level", "blast_radius_score", "risk_attributes"))
+
 
 def _is_terraform_plan(data: dict) -> bool:
     """True if JSON looks like a Terraform plan."""
-    return "resource_changes" in data or "terraform_version" in data
+    return not _PLAN_KEYS.isdisjoint(data.keys())
 
 
 def _is_core_output(data: dict) -> bool:
     """True if JSON looks like PreApply CoreOutput."""
-    return "risk_level" in data and "blast_radius_score" in data and "risk_attributes" in data
+    return _CORE_KEYS <= data.keys()
+
+
+def _classify_json_head(path) -> str:
+    """Classify a JSON file as "core", "plan", or "unknown" from its head.
+
+    Both formats carry their discriminator keys near the top of the file, so
+    peeking 64 KB classifies a multi-MB Terraform plan without parsing it
+    just to throw the dict away before re-running analysis.
+    """
+    with open(path, "rb") as f:
+        head = f.read(65536)
+    if b'"risk_level"' in head:
+        return "core"
+    if b'"resource_changes"' in head or b'"terraform_version"' in head:
+        return "plan"
+    return "unknown"
 
 
-def _load_output_from_file(file_path: str) -> CoreOutput:
+def _load_output_from_file(file_path: str, use_cache: bool = True) -> "CoreOutput":
     """
     Load CoreOutput from file. Accepts either Terraform plan (runs analysis)
     or PreApply analysis JSON (CoreOutput).
     """
+    # Imported here so `preapply --help` never pays for the pydantic contracts
+    # or the analysis pipeline.
+    from ...contracts.core_output import CoreOutput
+    from ..utils import run_analysis
+
     path = resolve_file_path(file_path)
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+
+    # Plans go straight to analysis: run_analysis parses (and validates) the
+    # file itself, so the full parse below would be pure waste.
+    if _classify_json_head(path) == "plan":
+        click.echo("Detected Terraform plan - running analysis first...", err=True)
+        return run_analysis(str(path), use_cache=use_cache)
+
+    # read_bytes hands the parser one contiguous buffer instead of paying the
+    # BufferedReader chunking tax on multi-MB plans; the jsonio helper uses
+    # orjson when installed (its JSONDecodeError subclasses the stdlib one,
+    # so the handlers below are unaffected).
+    data = json_loads(Path(path).read_bytes())
 
     if _is_core_output(data):
-        return CoreOutput(**data)
+        return CoreOutput.model_validate(data)
     if _is_terraform_plan(data):
+        # Plan whose discriminator keys sat past the 64 KB head peek - reuse
+        # the dict we just parsed instead of re-reading the file.
         click.echo("Detected Terraform plan - running analysis first...", err=True)
-        return run_analysis(str(path))
+        return run_analysis(str(path), plan_data=data, use_cache=use_cache)
     raise ValueError(
         "File is neither a Terraform plan nor a PreApply analysis. "
         "Use a plan from 'terraform plan -out=tfplan' (then terraform show -json tfplan > plan.json) "
@@ -44,18 +97,32 @@ def _load_output_from_file(file_path: str) -> CoreOutput:
     )
 
 
+# Resolved OllamaAdvisor class: None = not probed yet, False = import failed.
+# Caching avoids paying the ai submodule import twice per invocation (once for
+# the install check, once for advisor construction).
+_ollama_cls = None
+
+
+def _get_ollama_cls():
+    """Import OllamaAdvisor once and memoize the result."""
+    global _ollama_cls
+    if _ollama_cls is None:
+        try:
+            from ...ai.ollama import OllamaAdvisor
+            _ollama_cls = OllamaAdvisor
+        except ImportError:
+            _ollama_cls = False
+    return _ollama_cls
+
+
 def _check_ai_installed() -> bool:
     """
     Check if AI support is installed.
-    
+
     Returns:
         True if AI dependencies are available, False otherwise
     """
-    try:
-        from ...ai.ollama import OllamaAdvisor
-        return True
-    except ImportError:
-        return False
+    return _get_ollama_cls() is not False
 
 
 def _get_ollama_advisor(model: Optional[str] = None):
@@ -71,23 +138,20 @@ def _get_ollama_advisor(model: Optional[str] = None):
     Raises:
         PreApplyError: If AI is not installed or Ollama is not available
     """
-    # Check if AI is installed
-    if not _check_ai_installed():
+    # Check if AI is installed (memoized import probe)
+    advisor_cls = _get_ollama_cls()
+    if advisor_cls is False:
         raise PreApplyError(
             "AI support is not installed. Install it with: pip install 'preapply[ai]'"
         )
-    
+
     try:
-        from ...ai.ollama import OllamaAdvisor
-        return OllamaAdvisor(model=model or "llama3.2")
+        return advisor_cls(model=model or "llama3.2")
     except PreApplyError as e:
         # Ollama not running or not available
         error_msg = str(e)
         if "not available" in error_msg.lower():
-            raise PreApplyError(
-                "Ollama is not running. Please start Ollama and try again. "
-                "Visit https://ollama.ai for installation instructions."
-            )
+            raise PreApplyError(_ERR_OLLAMA_NOT_RUNNING)
         raise
     except Exception as e:
         raise PreApplyError(f"Failed to initialize Ollama advisor: {e}")
@@ -95,30 +159,34 @@ def _get_ollama_advisor(model: Optional[str] = None):
 
 @click.command()
 @click.argument('provider_keyword', type=str)
-@click.argument('question', type=str)
-@click.argument('file_path', type=click.Path(exists=False))
+@click.argument('question', type=str, required=False)
+@click.argument('file_path', type=click.Path(exists=False), required=False)
 @click.option('--model', default='llama3.2', help='Ollama model name (default: llama3.2)')
 @click.option('--max-tokens', type=int, help='Maximum tokens for response')
 @click.option('--json', 'output_json', is_flag=True, help='Output JSON format')
-def ask(provider_keyword, question, file_path, model, max_tokens, output_json):
+@click.option('--questions-file', type=click.Path(exists=True),
+              help='Read one question per line and answer all in a single run')
+@click.option('--no-cache', is_flag=True, help='Do not reuse cached analysis or AI responses')
+def ask(provider_keyword, question, file_path, model, max_tokens, output_json, questions_file, no_cache):
     """
     Ask AI advisor about PreApply analysis (read-only helper).
-    
+
     IMPORTANT: AI is just a helper. It cannot:
     - Edit or modify anything
     - Change risk scores or levels
     - Affect policy decisions
     - Modify the plan or analysis
-    
+
     AI only helps you understand what's inside the plan file and answers
     questions related to the analysis.
-    
+
     Syntax: preapply ask ai "Question" file.json
-    
+
     Examples:
         preapply ask ai "What is the worst case impact?" analysis.json
         preapply ask ai "How can I reduce risk?" analysis.json
         preapply ask ai "Explain the blast radius" analysis.json --model llama3.1
+        preapply ask ai --questions-file questions.txt analysis.json
     """
     try:
         # Validate provider keyword
@@ -127,21 +195,32 @@ def ask(provider_keyword, question, file_path, model, max_tokens, output_json):
                 f"Invalid provider keyword: {provider_keyword}. Use 'ai' to enable AI advisor."
             ), err=True)
             click.get_current_context().exit(1)
-        
+
+        # With --questions-file the question positional is omitted, so the
+        # single remaining positional is the file path
+        if questions_file and file_path is None:
+            file_path, question = question, None
+
+        questions = [question] if question else []
+        if questions_file:
+            with open(questions_file, 'r', encoding='utf-8') as f:
+                questions.extend(line.strip() for line in f if line.strip())
+
+        if not questions or not file_path:
+            click.echo(format_error(
+                "Provide a question and a file: preapply ask ai \"Question\" file.json "
+                "(or --questions-file questions.txt file.json)"
+            ), err=True)
+            click.get_current_context().exit(1)
+
         # Load CoreOutput (from analysis JSON or Terraform plan)
         try:
-            output_obj = _load_output_from_file(file_path)
+            output_obj = _load_output_from_file(file_path, use_cache=not no_cache)
         except FileNotFoundError as e:
-            error_msg = (
-                f"{e}\n\nYou can use either:\n"
-                "  • A Terraform plan: preapply ask ai \"Your question\" plan.json\n"
-                "  • Or save analysis first: preapply analyze plan.json --json -o analysis.json"
-            )
-            click.echo(format_error(error_msg), err=True)
+            click.echo(format_error(_ERR_FILE_NOT_FOUND.format(error=e)), err=True)
             click.get_current_context().exit(1)
-        except json.JSONDecodeError as e:
-            error_msg = f"The file {file_path} is not valid JSON."
-            click.echo(format_error(error_msg), err=True)
+        except json.JSONDecodeError:
+            click.echo(format_error(_ERR_NOT_JSON.format(path=file_path)), err=True)
             click.get_current_context().exit(1)
         except ValueError as e:
             click.echo(format_error(str(e)), err=True)
@@ -150,50 +229,81 @@ def ask(provider_keyword, question, file_path, model, max_tokens, output_json):
             click.echo(format_error(str(e)), err=True)
             click.get_current_context().exit(1)
         
-        # Get AI advisor
-        try:
-            advisor = _get_ollama_advisor(model)
-        except PreApplyError as e:
-            click.echo(format_error(str(e)), err=True)
-            click.get_current_context().exit(1)
-        
-        # Check if advisor is available
-        if not advisor.is_available():
-            click.echo(format_error(
-                "Ollama is not running. Please start Ollama and try again. "
-                "Visit https://ollama.ai for installation instructions."
-            ), err=True)
-            click.get_current_context().exit(1)
-        
-        # Get AI response
-        try:
-            response = advisor.ask(output_obj, question, max_tokens=max_tokens)
-        except PreApplyError as e:
-            click.echo(format_error(str(e)), err=True)
-            click.get_current_context().exit(1)
-        
-        # Output response (clearly labeled as ADVISORY)
+        # Response cache: re-asking a question about an unchanged analysis
+        # returns the stored answer without an LLM call (and without needing
+        # Ollama at all when every question hits)
+        from ...ai.cache import ResponseCache
+        cache = ResponseCache()
+        fp = ResponseCache.fingerprint(output_obj)
+
+        # Get AI responses - the analysis and advisor (with its pooled HTTP
+        # session) are loaded once and reused across all questions, so a
+        # batch run pays CLI startup and analysis cost only once. Advisor
+        # construction already probes the Ollama server and raises
+        # PreApplyError when it is unreachable, so no separate
+        # is_available() check is needed.
+        advisor = None
+        answers = []
+        for q in questions:
+            cached = None if no_cache else cache.get(fp, q, model)
+            if cached is not None:
+                answers.append((q, cached, True))
+                continue
+            if advisor is None:
+                try:
+                    advisor = _get_ollama_advisor(model)
+                except PreApplyError as e:
+                    click.echo(format_error(str(e)), err=True)
+                    click.get_current_context().exit(1)
+            try:
+                response = advisor.ask(output_obj, q, max_tokens=max_tokens)
+            except PreApplyError as e:
+                click.echo(format_error(str(e)), err=True)
+                click.get_current_context().exit(1)
+            cache.put(fp, q, model, response)
+            answers.append((q, response, False))
+
+        # Output responses (clearly labeled as ADVISORY)
+        disclaimer = (
+            "AI is just a helper. It cannot edit, modify, or change anything. "
+            "It only helps you understand what's inside the plan file."
+        )
         if output_json:
             result = {
                 "advisory": True,
                 "ai_enabled": True,
                 "provider": "ollama",
                 "model": model,
-                "question": question,
-                "response": response,
-                "disclaimer": "AI is just a helper. It cannot edit, modify, or change anything. It only helps you understand what's inside the plan file."
             }
-            click.echo(json.dumps(result, indent=2))
+            if len(answers) == 1:
+                q, r, was_cached = answers[0]
+                result["question"] = q
+                result["response"] = r
+                result["cached"] = was_cached
+            else:
+                result["responses"] = [
+                    {"question": q, "response": r, "cached": was_cached}
+                    for q, r, was_cached in answers
+                ]
+            result["disclaimer"] = disclaimer
+            click.echo(dumps_indented(result))
         else:
-            click.echo("=" * 60)
-            click.echo("AI ADVISOR (Read-Only Helper)")
-            click.echo("=" * 60)
-            click.echo(f"\nQuestion: {question}\n")
-            click.echo(f"Response:\n{response}\n")
-            click.echo("-" * 60)
-            click.echo("NOTE: AI is just a helper. It cannot edit, modify, or change anything.")
-            click.echo("It only helps you understand what's inside the plan file.")
-            click.echo("=" * 60)
+            # Single write: one syscall instead of ~10 on unbuffered stdout
+            lines = [
+                "=" * 60,
+                "AI ADVISOR (Read-Only Helper)",
+                "=" * 60,
+            ]
+            for q, r, _ in answers:
+                lines.append(f"\nQuestion: {q}\n")
+                lines.append(f"Response:\n{r}\n")
+            lines.extend([
+                "-" * 60,
+                "NOTE: AI is just a helper. It cannot edit, modify, or change anything.",
+                "It only helps you understand what's inside the plan file.",
+                "=" * 60,
+            ])
+            click.echo("\n".join(lines))
     
     except PreApplyError as e:
         click.echo(format_error(str(e)), err=True)
@@ -3,23 +3,25 @@
 import json
 import click
 import sys
-from ...contracts.core_output import CoreOutput
-from ...presentation.explainer import explain_overall_with_id, explain_resource_with_id, list_resources as list_available_resources
+from pathlib import Path
 from ...utils.errors import PreApplyError
+from ...utils.jsonio import dumps_indented, loads as json_loads
 from ...utils.logging import get_logger
 from ..utils import run_analysis, validate_resource_id, format_error
 
 logger = get_logger("cli.explain")
 
 
+# CoreOutput discriminator keys, checked with one C-level set operation.
+_CORE_KEYS = frozenset(("version", "risk_level", "blast_radius_score"))
+
+
 def _is_core_output(data: dict) -> bool:
     """Check if JSON data is a PreApply CoreOutput."""
     return (
         isinstance(data, dict) and
-        "version" in data and
-        "risk_level" in data and
-        "blast_radius_score" in data and
-        "format_version" not in data  # Terraform plans have format_version
+        "format_version" not in data and  # Terraform plans have format_version
+        _CORE_KEYS <= data.keys()
     )
 
 
@@ -30,7 +32,8 @@ def _is_core_output(data: dict) -> bool:
 @click.option('--list-resources', is_flag=True, help='List all available resource IDs')
 @click.option('--quiet', is_flag=True, help='Suppress progress messages')
 @click.option('--from-json', type=click.Path(exists=True), help='Reuse analysis from JSON file instead of running analysis')
-def explain(input_file, resource_id, output_json, list_resources, quiet, from_json):
+@click.option('--no-cache', is_flag=True, help='Do not reuse cached analysis results')
+def explain(input_file, resource_id, output_json, list_resources, quiet, from_json, no_cache):
     """
     Explain risk assessment or specific resource (deterministic, no AI).
     
@@ -43,30 +46,40 @@ def explain(input_file, resource_id, output_json, list_resources, quiet, from_js
         preapply explain analysis.json          # Explain existing analysis
         preapply explain analysis.json aws_vpc.main  # Explain specific resource
     """
+    # Imported here so `preapply --help` never pays for the pydantic contracts
+    # or the explainer.
+    from ...contracts.core_output import CoreOutput
+    from ...presentation.explainer import (
+        explain_overall_with_id,
+        explain_resource_with_id,
+        list_resources as list_available_resources,
+    )
+
     try:
         # Load analysis result
         if from_json:
-            with open(from_json, 'r', encoding='utf-8') as f:
-                output_data = json.load(f)
-            output = CoreOutput(**output_data)
+            output_data = json_loads(Path(from_json).read_bytes())
+            output = CoreOutput.model_validate(output_data)
             if not quiet:
                 click.echo(f"Loaded analysis from: {from_json}", err=True)
         else:
             # Auto-detect if input is CoreOutput or Terraform plan
             try:
-                with open(input_file, 'r', encoding='utf-8') as f:
-                    file_data = json.load(f)
-                
+                # One contiguous read: avoids the buffered-reader chunking
+                # overhead on multi-MB Terraform plans.
+                file_data = json_loads(Path(input_file).read_bytes())
+
                 if _is_core_output(file_data):
                     # It's a PreApply analysis JSON
-                    output = CoreOutput(**file_data)
+                    output = CoreOutput.model_validate(file_data)
                     if not quiet:
                         click.echo(f"Loaded analysis from: {input_file}", err=True)
                 else:
-                    # It's a Terraform plan, analyze it
+                    # It's a Terraform plan, analyze it - hand over the dict
+                    # we just parsed so the file is not read a second time
                     if not quiet:
                         click.echo(f"Analyzing Terraform plan: {input_file}", err=True)
-                    output = run_analysis(input_file)
+                    output = run_analysis(input_file, plan_data=file_data, use_cache=not no_cache)
             except json.JSONDecodeError as e:
                 raise PreApplyError(f"Invalid JSON file: {input_file}. {e}")
             except FileNotFoundError:
@@ -103,7 +116,7 @@ def explain(input_file, resource_id, output_json, list_resources, quiet, from_js
                 "risk_level": str(output.risk_level),
                 "blast_radius_score": output.blast_radius_score
             }
-            click.echo(json.dumps(output_data, indent=2))
+            click.echo(dumps_indented(output_data))
         else:
             if not quiet:
                 click.echo("PreApply Explanation")
@@ -2,13 +2,10 @@
 
 import click
 import sys
-import json
-from ...contracts.core_output import CoreOutput
-from ...presentation.explainer import explain_overall_with_id, explain_resource_with_id
-from ...policy.engine import check_policies
+from pathlib import Path
 from ...utils.errors import PreApplyError
+from ...utils.jsonio import dumps_indented, loads as json_loads
 from ...utils.logging import get_logger
-from ...config.environment import load_environment_config, get_enforcement_mode
 from ..utils import run_analysis, format_error
 
 logger = get_logger("cli.policy")
@@ -29,8 +26,16 @@ def policy():
 @click.option('--from-json', type=click.Path(exists=True), help='Reuse analysis from JSON file instead of running analysis')
 @click.option('--environment', type=click.Path(exists=True), help='Path to environment config file (.preapply-env.yaml)')
 @click.option('--enforcement-mode', type=click.Choice(['auto', 'manual']), help='Override enforcement mode (auto=block, manual=require approval)')
-def check(plan_json, policy_file, resource_id, json_output, quiet, from_json, environment, enforcement_mode):
+@click.option('--no-cache', is_flag=True, help='Do not reuse cached analysis results')
+def check(plan_json, policy_file, resource_id, json_output, quiet, from_json, environment, enforcement_mode, no_cache):
     """Check policies against Terraform plan analysis."""
+    # Imported here so `preapply --help` never pays for the pydantic contracts,
+    # the explainer, or the policy engine.
+    from ...contracts.core_output import CoreOutput
+    from ...presentation.explainer import get_explanation_id
+    from ...policy.engine import check_policies
+    from ...config.environment import load_environment_config, get_enforcement_mode
+
     try:
         # Load environment configuration
         env_config = load_environment_config(env_config_path=environment)
@@ -41,9 +46,8 @@ def check(plan_json, policy_file, resource_id, json_output, quiet, from_json, en
         
         # Load analysis result
         if from_json:
-            with open(from_json, 'r', encoding='utf-8') as f:
-                output_data = json.load(f)
-            output = CoreOutput(**output_data)
+            output_data = json_loads(Path(from_json).read_bytes())
+            output = CoreOutput.model_validate(output_data)
             if not quiet:
                 click.echo(f"Loaded analysis from: {from_json}", err=True)
         else:
@@ -53,13 +57,10 @@ def check(plan_json, policy_file, resource_id, json_output, quiet, from_json, en
             if not quiet:
                 click.echo(f"Analyzing plan: {plan_json}", err=True)
             # Run analysis using shared helper
-            output = run_analysis(plan_json)
+            output = run_analysis(plan_json, use_cache=not no_cache)
         
-        # Get explanation ID
-        if resource_id:
-            explanation_id = explain_resource_with_id(output, resource_id)[1]
-        else:
-            explanation_id = explain_overall_with_id(output)[1]
+        # Get explanation ID (no need to render the explanation text here)
+        explanation_id = get_explanation_id(output, resource_id)
         
         # Check policies
         if not quiet:
@@ -83,43 +84,37 @@ def check(plan_json, policy_file, resource_id, json_output, quiet, from_json, en
                     for r in result.results
                 ]
             }
-            click.echo(json.dumps(output_data, indent=2))
+            click.echo(dumps_indented(output_data))
         else:
-            # Human-readable output
+            # Human-readable output, built up and emitted as one write
+            lines = []
             if not quiet:
-                click.echo("PreApply Policy Check")
-                click.echo("-" * 60)  # ASCII for compatibility
-                click.echo("")
-            
+                lines.append("PreApply Policy Check")
+                lines.append("-" * 60)  # ASCII for compatibility
+                lines.append("")
+
             # Show matched policies
             matched = [r for r in result.results if r.matched]
             if matched:
                 for r in matched:
                     # Use ASCII symbols for compatibility
                     action_symbol = "[FAIL]" if r.action.value == "fail" else "[WARN]" if r.action.value == "warn" else "[PASS]"
-                    try:
-                        click.echo(f"{action_symbol} {r.explanation}")
-                    except UnicodeEncodeError:
-                        safe_text = f"{action_symbol} {r.explanation}".encode('ascii', errors='replace').decode('ascii')
-                        click.echo(safe_text)
-                
-                click.echo("")
-                sys.stdout.flush()
-            
+                    lines.append(f"{action_symbol} {r.explanation}")
+                lines.append("")
+
             # Show summary
+            if result.passed:
+                lines.append("[PASS] Policy check PASSED")
+            else:
+                lines.append("[FAIL] Policy check FAILED")
+                lines.append(f"  {result.failure_count} policy violation(s) found")
+
+            text = "\n".join(lines)
             try:
-                if result.passed:
-                    click.echo("[PASS] Policy check PASSED")
-                else:
-                    click.echo("[FAIL] Policy check FAILED")
-                    click.echo(f"  {result.failure_count} policy violation(s) found")
+                click.echo(text)
             except UnicodeEncodeError:
-                if result.passed:
-                    click.echo("[PASS] Policy check PASSED")
-                else:
-                    click.echo("[FAIL] Policy check FAILED")
-                    click.echo(f"  {result.failure_count} policy violation(s) found")
-            sys.stdout.flush()
+                # Policy explanations may carry non-ASCII text
+                click.echo(text.encode('ascii', errors='replace').decode('ascii'))
         
         # Exit with appropriate code based on enforcement mode
         # 0 = success (passed)
@@ -3,16 +3,24 @@
 import json
 from pathlib import Path
 import click
-from ...contracts.core_output import CoreOutput
 from ...report.github import format_github_comment, post_pr_comment
 from ...report.markdown import generate_markdown
 from ...report.artifact import generate_artifacts
 from ...utils.errors import PreApplyError
 from ...utils.logging import get_logger
-from ..utils import format_error
+from ..utils import format_error, load_core_output
 
 logger = get_logger("cli.report")
 
+# Shared by all three subcommands; built once so each decoration reuses the
+# same option object and Path type, and path_type saves the Path() coercion
+# in the handlers.
+_core_output_opt = click.option(
+    '--core-output', '-i', required=True,
+    type=click.Path(exists=True, path_type=Path),
+    help='Path to CoreOutput JSON file',
+)
+
 
 @click.group()
 def report():
@@ -21,7 +29,7 @@ def report():
 
 
 @report.command()
-@click.option('--core-output', '-i', required=True, type=click.Path(exists=True), help='Path to CoreOutput JSON file')
+@_core_output_opt
 @click.option('--repo', required=True, help='GitHub repository (owner/repo)')
 @click.option('--pr', required=True, type=int, help='Pull request number')
 @click.option('--token', envvar='GITHUB_TOKEN', help='GitHub token (or use GITHUB_TOKEN env var)')
@@ -30,11 +38,8 @@ def github(core_output, repo, pr, token, update):
     """Post PreApply analysis as GitHub PR comment."""
     try:
         # Load CoreOutput
-        core_output_path = Path(core_output)
-        with open(core_output_path, 'r', encoding='utf-8') as f:
-            output_data = json.load(f)
-        output = CoreOutput(**output_data)
-        
+        output = load_core_output(core_output)
+
         # Format comment
         comment = format_github_comment(output)
         
@@ -60,17 +65,14 @@ def github(core_output, repo, pr, token, update):
 
 
 @report.command()
-@click.option('--core-output', '-i', required=True, type=click.Path(exists=True), help='Path to CoreOutput JSON file')
+@_core_output_opt
 @click.option('--output', '-o', required=True, type=click.Path(), help='Output markdown file path')
 def markdown(core_output, output):
     """Generate markdown report from CoreOutput."""
     try:
         # Load CoreOutput
-        core_output_path = Path(core_output)
-        with open(core_output_path, 'r', encoding='utf-8') as f:
-            output_data = json.load(f)
-        output_obj = CoreOutput(**output_data)
-        
+        output_obj = load_core_output(core_output)
+
         # Generate markdown
         output_path = Path(output)
         generate_markdown(output_obj, output_path)
@@ -90,17 +92,14 @@ def markdown(core_output, output):
 
 
 @report.command()
-@click.option('--core-output', '-i', required=True, type=click.Path(exists=True), help='Path to CoreOutput JSON file')
+@_core_output_opt
 @click.option('--output', '-o', required=True, type=click.Path(), help='Output directory for artifacts')
 def artifact(core_output, output):
     """Generate CI/CD artifacts from CoreOutput."""
     try:
         # Load CoreOutput
-        core_output_path = Path(core_output)
-        with open(core_output_path, 'r', encoding='utf-8') as f:
-            output_data = json.load(f)
-        output_obj = CoreOutput(**output_data)
-        
+        output_obj = load_core_output(core_output)
+
         # Generate artifacts
         output_dir = Path(output)
         generate_artifacts(output_obj, output_dir)
@@ -1,30 +1,27 @@
 """Summary command - generate short paragraph summary."""
 
-import json
 import click
 import sys
-from ...contracts.core_output import CoreOutput
 from ...presentation.explainer import generate_summary_with_id
 from ...utils.errors import PreApplyError
+from ...utils.jsonio import dumps_indented
 from ...utils.logging import get_logger
-from ..utils import run_analysis, format_error
+from ..utils import run_analysis, format_error, load_core_output
 
 logger = get_logger("cli.summary")
 
 
 @click.command()
 @click.argument('plan_json', type=click.Path(exists=False))
-@click.option('--json', is_flag=True, help='Output structured JSON')
+@click.option('--json', 'as_json', is_flag=True, help='Output structured JSON')
 @click.option('--quiet', is_flag=True, help='Suppress progress messages')
 @click.option('--from-json', type=click.Path(exists=True), help='Reuse analysis from JSON file instead of running analysis')
-def summary(plan_json, json, quiet, from_json):
+def summary(plan_json, as_json, quiet, from_json):
     """Generate short paragraph summary of risk assessment."""
     try:
         # Load analysis result
         if from_json:
-            with open(from_json, 'r', encoding='utf-8') as f:
-                output_data = json.load(f)
-            output = CoreOutput(**output_data)
+            output = load_core_output(from_json)
             if not quiet:
                 click.echo(f"Loaded analysis from: {from_json}", err=True)
         else:
@@ -36,24 +33,26 @@ def summary(plan_json, json, quiet, from_json):
         summary_text, explanation_id = generate_summary_with_id(output)
         
         # Output
-        if json:
+        if as_json:
             output_data = {
                 "summary": summary_text,
                 "explanation_id": explanation_id.value if hasattr(explanation_id, 'value') else str(explanation_id),
-                "risk_level": output.risk_level.value,
+                "risk_level": output.risk_level.value if hasattr(output.risk_level, 'value') else str(output.risk_level),
                 "blast_radius_score": output.blast_radius_score
             }
-            click.echo(json.dumps(output_data, indent=2))
+            click.echo(dumps_indented(output_data))
         else:
             if not quiet:
                 click.echo("PreApply Summary")
                 click.echo("-" * 60)
                 click.echo("")
-            try:
-                click.echo(summary_text)
-            except UnicodeEncodeError:
-                safe_text = summary_text.encode('ascii', errors='replace').decode('ascii')
-                click.echo(safe_text)
+            # Narrow-encoding consoles (e.g. Windows code pages) would raise
+            # UnicodeEncodeError on every run; degrade once up front instead
+            # of via exception control flow
+            enc = (sys.stdout.encoding or 'utf-8').lower()
+            if enc not in ('utf-8', 'utf8'):
+                summary_text = summary_text.encode(enc, errors='replace').decode(enc)
+            click.echo(summary_text)
         
     except PreApplyError as e:
         click.echo(format_error(str(e)), err=True)
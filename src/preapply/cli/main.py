@@ -1,14 +1,9 @@
 """Main CLI entry point for PreApply."""
 
+import importlib
+
 import click
-from .commands.setup import setup
-from .commands.ai import ai
-from .commands.analyze import analyze
-from .commands.explain import explain
-from .commands.summary import summary
-from .commands.policy import policy
-from .commands.report import report
-from .commands.ask import ask
+
 from ..utils.logging import get_logger
 
 try:
@@ -18,23 +13,39 @@ except Exception as e:
 
 logger = get_logger("cli.main")
 
-
-@click.group()
+# Command name -> module of the same name under .commands; each module
+# exposes a Click command (or group) named after itself. Commands are
+# imported lazily so `preapply --help` and `preapply version` never pay
+# for the heavy transitive imports (pydantic, yaml, requests) the other
+# commands pull in.
+_COMMANDS = (
+    "analyze",
+    "explain",
+    "summary",
+    "policy",
+    "report",
+    "ask",
+    "setup",
+    "ai",
+    "version",
+)
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx):
+        return sorted(_COMMANDS)
+
+    def get_command(self, ctx, name):
+        if name not in _COMMANDS:
+            return None
+        module = importlib.import_module(f".commands.{name}", __package__)
+        return getattr(module, name)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="preapply", message="%(prog)s version %(version)s")
 def cli():
     """PreApply - Infrastructure risk analysis."""
     pass
-
-
-cli.add_command(analyze)
-cli.add_command(explain)
-cli.add_command(summary)
-cli.add_command(policy)
-cli.add_command(report)
-cli.add_command(ask)
-cli.add_command(setup)
-cli.add_command(ai)
-
-# Import and add version command at the end
-from .commands.version import version as version_command
-cli.add_command(version_command)
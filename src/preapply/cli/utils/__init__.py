@@ -1,6 +1,9 @@
 """CLI utilities package."""
 
+import hashlib
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional, List
 from ...utils.errors import PreApplyError
@@ -9,6 +12,12 @@ from .file_resolver import resolve_file_path
 
 logger = get_logger("cli.utils")
 
+# Content-addressed analysis cache: explain, policy check, and ask run on the
+# same plan in a typical CI flow, and only the first invocation should pay
+# for analysis. Keyed on the plan bytes plus the package version (scoring
+# defaults ship with the package, so a version bump invalidates old entries).
+_ANALYSIS_CACHE_DIR = Path.home() / ".preapply" / "cache" / "analyses"
+
 
 def validate_plan_json(plan_path: str) -> Tuple[bool, Optional[str], Optional[dict]]:
     """
@@ -26,8 +35,10 @@ def validate_plan_json(plan_path: str) -> Tuple[bool, Optional[str], Optional[di
         return False, f"Path is not a file: {plan_path}", None
     
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            plan_data = json.load(f)
+        # orjson-aware helper that mmaps large plans; its decode errors
+        # subclass json.JSONDecodeError so the handler below holds
+        from ...utils.jsonio import loads_path
+        plan_data = loads_path(path)
         return True, None, plan_data
     except json.JSONDecodeError as e:
         return False, f"Invalid JSON in plan file: {e}", None
@@ -35,46 +46,76 @@ def validate_plan_json(plan_path: str) -> Tuple[bool, Optional[str], Optional[di
         return False, f"Error reading plan file: {e}", None
 
 
+# Exact-id lookup index for the last-seen risk_attributes object, checked by
+# identity. Commands validate several ids against one analysis per process,
+# so the dict is built once and exact hits resolve in O(1).
+_resource_index_cache = None
+
+
+def _get_resource_index(attrs) -> dict:
+    """Map resource_id to (is_shared, entry) for exact-match lookups."""
+    global _resource_index_cache
+    cached = _resource_index_cache
+    if cached is not None and cached[0] is attrs:
+        return cached[1]
+    index = {dep.resource_id: (True, dep) for dep in attrs.shared_dependencies}
+    for crit in attrs.critical_infrastructure:
+        # Shared entries take precedence, matching the original scan order
+        index.setdefault(crit.resource_id, (False, crit))
+    _resource_index_cache = (attrs, index)
+    return index
+
+
+def _shared_result(dep) -> dict:
+    return {
+        "resource_id": dep.resource_id,
+        "resource_type": dep.resource_type,
+        "dependents": dep.dependents,
+        "is_critical": dep.is_critical,
+        "is_shared": True,
+        "risk_reason": dep.risk_reason
+    }
+
+
+def _critical_result(crit) -> dict:
+    return {
+        "resource_id": crit.resource_id,
+        "resource_type": crit.resource_type,
+        "dependents": None,
+        "is_critical": True,
+        "is_shared": False,
+        "risk_reason": crit.risk_reason
+    }
+
+
 def validate_resource_id(output, resource_id: str) -> Tuple[bool, Optional[str], Optional[dict]]:
     """
     Validate resource_id exists in analysis output.
-    
+
     Returns:
         Tuple of (is_valid, error_message, resource_data)
     """
     attrs = output.risk_attributes
-    
-    # Check shared dependencies
+
+    # Exact match first: O(1) regardless of analysis size
+    hit = _get_resource_index(attrs).get(resource_id)
+    if hit is not None:
+        is_shared, entry = hit
+        return True, None, _shared_result(entry) if is_shared else _critical_result(entry)
+
+    # Fall back to the substring scan (exact ids were covered above)
     for dep in attrs.shared_dependencies:
-        if dep.resource_id == resource_id or resource_id in dep.resource_id:
-            return True, None, {
-                "resource_id": dep.resource_id,
-                "resource_type": dep.resource_type,
-                "dependents": dep.dependents,
-                "is_critical": dep.is_critical,
-                "is_shared": True,
-                "risk_reason": dep.risk_reason
-            }
-    
-    # Check critical infrastructure
+        if resource_id in dep.resource_id:
+            return True, None, _shared_result(dep)
+
     for crit in attrs.critical_infrastructure:
-        if crit.resource_id == resource_id or resource_id in crit.resource_id:
-            return True, None, {
-                "resource_id": crit.resource_id,
-                "resource_type": crit.resource_type,
-                "dependents": None,
-                "is_critical": True,
-                "is_shared": False,
-                "risk_reason": crit.risk_reason
-            }
-    
+        if resource_id in crit.resource_id:
+            return True, None, _critical_result(crit)
+
     # Resource not found - suggest similar ones
-    all_resources = []
-    for dep in attrs.shared_dependencies:
-        all_resources.append(dep.resource_id)
-    for crit in attrs.critical_infrastructure:
-        all_resources.append(crit.resource_id)
-    
+    all_resources = [dep.resource_id for dep in attrs.shared_dependencies]
+    all_resources.extend(crit.resource_id for crit in attrs.critical_infrastructure)
+
     suggestions = _find_similar_resources(resource_id, all_resources)
     
     error_msg = f"Resource '{resource_id}' not found in analysis."
@@ -87,18 +128,21 @@ def validate_resource_id(output, resource_id: str) -> Tuple[bool, Optional[str],
 
 
 def _find_similar_resources(target: str, resources: List[str]) -> List[str]:
-    """Find resources with similar names to target."""
+    """Find resources with similar names to target (at most 5)."""
     target_lower = target.lower()
+    # Split the target once instead of per candidate
+    target_parts = tuple(p for p in target_lower.split('.') if len(p) > 2)
     similar = []
-    
+
     for resource in resources:
         resource_lower = resource.lower()
-        if target_lower in resource_lower or resource_lower in target_lower:
+        if (target_lower in resource_lower or resource_lower in target_lower
+                or any(p in resource_lower for p in target_parts)):
             similar.append(resource)
-        elif any(part in resource_lower for part in target_lower.split('.') if len(part) > 2):
-            similar.append(resource)
-    
-    return similar[:5]
+            if len(similar) >= 5:
+                break
+
+    return similar
 
 
 def format_error(message: str, suggestion: Optional[str] = None) -> str:
@@ -125,49 +169,119 @@ def format_error(message: str, suggestion: Optional[str] = None) -> str:
         return error
 
 
-def run_analysis(plan_json: str) -> "CoreOutput":
+@lru_cache(maxsize=4)
+def _load_core_output_cached(path_str: str, mtime_ns: int) -> "CoreOutput":
+    from ...contracts.core_output import CoreOutput
+    from ...utils.jsonio import loads_path
+    data = loads_path(path_str)
+    return CoreOutput.model_validate(data)
+
+
+def load_core_output(core_output_path: str) -> "CoreOutput":
+    """
+    Load a CoreOutput JSON file, reusing the parsed model when the same
+    file is loaded again in one process (chained report invocations).
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        OSError: If the file cannot be read
+    """
+    path = Path(core_output_path)
+    return _load_core_output_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _analysis_cache_path(raw_bytes: bytes) -> Path:
+    """Cache file path for a plan's analysis, addressed by content hash."""
+    from ... import __version__
+    digest = hashlib.sha256(raw_bytes)
+    digest.update(__version__.encode("utf-8"))
+    return _ANALYSIS_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+def run_analysis(
+    plan_json: str,
+    plan_data: Optional[dict] = None,
+    use_cache: bool = True,
+) -> "CoreOutput":
     """
     Shared analysis execution helper - all commands call this.
-    
+
     Args:
         plan_json: Path to Terraform plan JSON file
-        
+        plan_data: Already-parsed plan dict; when supplied the file is not
+            re-read or re-parsed
+        use_cache: Reuse a previously cached analysis of identical plan bytes
+
     Returns:
         CoreOutput object
-        
+
     Raises:
         PreApplyError: If analysis fails
     """
     from ... import analyze as analyze_core
-    
-    # Validate plan.json first
-    is_valid, error_msg, plan_data = validate_plan_json(plan_json)
-    if not is_valid:
-        raise PreApplyError(error_msg)
-    
+    from ...contracts.core_output import CoreOutput as CO
+
+    # Cache lookup by plan content - a hit skips analysis entirely. Cache
+    # errors of any kind degrade to a normal analysis run.
+    cache_path = None
+    if use_cache:
+        try:
+            raw_bytes = Path(plan_json).read_bytes()
+        except OSError:
+            raw_bytes = None
+        if raw_bytes is not None:
+            cache_path = _analysis_cache_path(raw_bytes)
+            if cache_path.exists():
+                try:
+                    output = CO.model_validate_json(cache_path.read_bytes())
+                    logger.debug("Analysis cache hit: %s", cache_path)
+                    return output
+                except Exception as e:
+                    logger.debug("Ignoring unreadable analysis cache entry: %s", e)
+
+    # Validate plan.json first (skipped when the caller already parsed it)
+    if plan_data is None:
+        is_valid, error_msg, plan_data = validate_plan_json(plan_json)
+        if not is_valid:
+            raise PreApplyError(error_msg)
+
     # Check if plan has changes
     if plan_data and "resource_changes" in plan_data:
         if len(plan_data["resource_changes"]) == 0:
             # Empty plan
-            output_dict = handle_empty_plan()
-            from ...contracts.core_output import CoreOutput as CO
-            return CO(**output_dict)
-    
-    # Run analysis
-    result = analyze_core(plan_json)
-    
+            return handle_empty_plan()
+
+    # Run analysis on the dict we already hold - analyze() skips its own
+    # file read when plan_data is supplied
+    result = analyze_core(plan_json, plan_data=plan_data)
+
     # Convert to CoreOutput
-    from ...contracts.core_output import CoreOutput as CO
     if isinstance(result, dict) and "structured" in result:
-        return CO(**result["structured"])
+        output = CO.model_validate(result["structured"])
     elif isinstance(result, dict):
-        return CO(**result)
+        output = CO.model_validate(result)
     else:
         raise PreApplyError(f"Unexpected analysis result type: {type(result)}")
 
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(output.model_dump_json().encode("utf-8"))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Could not write analysis cache: %s", e)
+
+    return output
 
-def handle_empty_plan() -> dict:
-    """Handle empty plan (no changes) case."""
+
+@lru_cache(maxsize=1)
+def handle_empty_plan() -> "CoreOutput":
+    """Handle empty plan (no changes) case.
+
+    The output is identical for every empty plan, so the instance is built
+    once per process and shared; callers treat CoreOutput as read-only.
+    """
     from ...contracts.core_output import CoreOutput, RiskLevel
     from ...contracts.risk_attributes import RiskAttributes, BlastRadiusMetrics
 
@@ -190,7 +304,7 @@ def handle_empty_plan() -> dict:
         risk_factors=[],
         recommendations=[]
     )
-    return output.model_dump()
+    return output
 
 
-__all__ = ["resolve_file_path", "run_analysis", "format_error", "validate_resource_id", "validate_plan_json"]
+__all__ = ["resolve_file_path", "run_analysis", "format_error", "validate_resource_id", "validate_plan_json", "load_core_output"]
@@ -1,5 +1,6 @@
 """Configuration module: Load and access scoring weights and thresholds."""
 
+import copy
 from pathlib import Path
 import yaml
 from typing import Dict, Any
@@ -10,17 +11,66 @@ from .paths import get_config_path, get_user_config_path, get_project_config_pat
 
 logger = get_logger("config")
 
+# libyaml's C parser is several times faster than the pure-Python fallback.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Validation metadata, built once instead of per load call.
+_REQUIRED_SECTIONS = ("blast_radius", "risk_levels", "shared_resources")
+_REQUIRED_BR_WEIGHTS = (
+    "shared_resource_weight",
+    "downstream_service_weight",
+    "delete_action_multiplier",
+    "update_action_multiplier",
+    "create_action_multiplier",
+)
+_REQUIRED_LEVELS = ("low", "medium", "high")
+
+# Static portion of the legacy-config migration; the infrastructure section
+# is filled in per call from the config's blast_radius/shared_resources.
+_LEGACY_RISK_SCORING = {
+    "data_loss": {"base_weight": 50, "decay_factor": 0.85, "state_destructive_multiplier": 0.6},
+    "security": {"base_weight": 40, "decay_factor": 0.90, "sensitive_port_penalty": 20},
+    "cost": {"creation_weight": 15, "scaling_weight": 10, "decay_factor": 0.90},
+    "interactions": {
+        "data_security": {"thresholds": [40, 40], "bonus": 0.35},
+        "infrastructure_security": {"thresholds": [60, 40], "bonus": 0.30},
+        "data_infrastructure": {"thresholds": [40, 60], "bonus": 0.25},
+        "cost_infrastructure": {"thresholds": [30, 60], "bonus": 0.20},
+        "multi_dimension": {"threshold": 35, "three_plus_bonus": 0.40, "two_bonus": 0.15},
+    },
+    "blast_radius": {
+        "base_multiplier": 10,
+        "weights": {"infrastructure": 1.0, "security": 0.4, "data": 0.2, "cost": 0.5},
+    },
+    "thresholds": {
+        "critical_catastrophic": 200,
+        "critical": 150,
+        "high_severe": 100,
+        "high": 70,
+        "medium": 40,
+    },
+}
+
+# Parsed-config cache keyed on (path, mtime_ns): repeated calls in one
+# process (multi-command runs, tests) skip the YAML parse, migration, and
+# validation. Entries are deep-copied on the way out so callers can mutate
+# their config freely.
+_config_cache: Dict[tuple, Dict[str, Any]] = {}
+
 
 def load_scoring_config(config_path: str = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
-    
+
     Args:
         config_path: Path to config YAML file. If None, uses defaults.yaml
-        
+
     Returns:
         Configuration dictionary
-        
+
     Raises:
         ConfigError: If config cannot be loaded
     """
@@ -29,13 +79,22 @@ def load_scoring_config(config_path: str = None) -> Dict[str, Any]:
         config_path = Path(__file__).parent / "defaults.yaml"
     else:
         config_path = Path(config_path)
-    
+
     if not config_path.exists():
         raise ConfigError(f"Config file not found: {config_path}")
-    
+
+    try:
+        cache_key = (str(config_path), config_path.stat().st_mtime_ns)
+    except OSError:
+        cache_key = None
+    if cache_key is not None:
+        cached = _config_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
         
         if not isinstance(config, dict):
             raise ConfigError("Config file must contain a dictionary")
@@ -44,40 +103,18 @@ def load_scoring_config(config_path: str = None) -> Dict[str, Any]:
         if "risk_scoring" not in config:
             blast = config.get("blast_radius", {})
             shared = config.get("shared_resources", {})
-            config["risk_scoring"] = {
-                "data_loss": {"base_weight": 50, "decay_factor": 0.85, "state_destructive_multiplier": 0.6},
-                "infrastructure": {
-                    "shared_resource_base": blast.get("shared_resource_weight", 30),
-                    "critical_multiplier": blast.get("critical_infrastructure_multiplier", 1.3),
-                    "critical_types": shared.get("critical_types", []),
-                },
-                "security": {"base_weight": 40, "decay_factor": 0.90, "sensitive_port_penalty": 20},
-                "cost": {"creation_weight": 15, "scaling_weight": 10, "decay_factor": 0.90},
-                "interactions": {
-                    "data_security": {"thresholds": [40, 40], "bonus": 0.35},
-                    "infrastructure_security": {"thresholds": [60, 40], "bonus": 0.30},
-                    "data_infrastructure": {"thresholds": [40, 60], "bonus": 0.25},
-                    "cost_infrastructure": {"thresholds": [30, 60], "bonus": 0.20},
-                    "multi_dimension": {"threshold": 35, "three_plus_bonus": 0.40, "two_bonus": 0.15},
-                },
-                "blast_radius": {
-                    "base_multiplier": 10,
-                    "weights": {"infrastructure": 1.0, "security": 0.4, "data": 0.2, "cost": 0.5},
-                },
-                "thresholds": {
-                    "critical_catastrophic": 200,
-                    "critical": 150,
-                    "high_severe": 100,
-                    "high": 70,
-                    "medium": 40,
-                },
+            risk_scoring = copy.deepcopy(_LEGACY_RISK_SCORING)
+            risk_scoring["infrastructure"] = {
+                "shared_resource_base": blast.get("shared_resource_weight", 30),
+                "critical_multiplier": blast.get("critical_infrastructure_multiplier", 1.3),
+                "critical_types": shared.get("critical_types", []),
             }
+            config["risk_scoring"] = risk_scoring
             logger.info("Auto-migrated legacy config to risk_scoring section")
 
         # Validate required sections
-        required_sections = ["blast_radius", "risk_levels", "shared_resources"]
-        missing_sections = [s for s in required_sections if s not in config]
-        
+        missing_sections = [s for s in _REQUIRED_SECTIONS if s not in config]
+
         # Validate nested structures
         validation_issues = []
         
@@ -87,8 +124,7 @@ def load_scoring_config(config_path: str = None) -> Dict[str, Any]:
             if not isinstance(br_config, dict):
                 validation_issues.append("blast_radius is not a dict")
             else:
-                required_weights = ["shared_resource_weight", "downstream_service_weight", "delete_action_multiplier", "update_action_multiplier", "create_action_multiplier"]
-                missing_weights = [w for w in required_weights if w not in br_config]
+                missing_weights = [w for w in _REQUIRED_BR_WEIGHTS if w not in br_config]
                 if missing_weights:
                     validation_issues.append(f"blast_radius missing: {missing_weights}")
         
@@ -98,8 +134,7 @@ def load_scoring_config(config_path: str = None) -> Dict[str, Any]:
             if not isinstance(rl_config, dict):
                 validation_issues.append("risk_levels is not a dict")
             else:
-                required_levels = ["low", "medium", "high"]
-                missing_levels = [l for l in required_levels if l not in rl_config]
+                missing_levels = [l for l in _REQUIRED_LEVELS if l not in rl_config]
                 if missing_levels:
                     validation_issues.append(f"risk_levels missing: {missing_levels}")
         
@@ -115,8 +150,10 @@ def load_scoring_config(config_path: str = None) -> Dict[str, Any]:
                     validation_issues.append("critical_types is not a list")
         
         logger.info(f"Loaded configuration from {config_path}")
+        if cache_key is not None:
+            _config_cache[cache_key] = copy.deepcopy(config)
         return config
-        
+
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in config file: {e}")
     except Exception as e:
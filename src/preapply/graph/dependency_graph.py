@@ -1,7 +1,8 @@
 """Build directed dependency graph from normalized resources."""
 
 import networkx as nx
-from typing import List, Dict, Set, Optional
+from collections import deque
+from typing import Iterable, List, Dict, FrozenSet, Set, Optional
 from ..ingest.models import NormalizedResource
 from ..utils.errors import GraphConstructionError
 from ..utils.logging import get_logger
@@ -15,24 +16,30 @@ class DependencyGraph:
     def __init__(self):
         self.graph = nx.DiGraph()
         self._resource_map: Dict[str, NormalizedResource] = {}
-    
+        self._downstream_cache: Dict[str, FrozenSet[str]] = {}
+        # Flat per-node lookup tables so hot loops avoid touching the full
+        # NormalizedResource objects (see calculate_blast_radius).
+        self.node_component: Dict[str, str] = {}
+        self.node_resource_id: Dict[str, str] = {}
+
     def add_resource(self, resource: NormalizedResource) -> None:
         """Add a resource to the graph."""
+        self._downstream_cache.clear()
         node_id = self.get_node_id(resource)
         self.graph.add_node(node_id, resource=resource)
         self._resource_map[node_id] = resource
+        self.node_component[node_id] = resource.module if resource.module else resource.type
+        self.node_resource_id[node_id] = resource.id
         
         for dep_address in resource.depends_on:
             dep_node_id = self._find_dependency_node(dep_address, resource)
             if dep_node_id:
                 self.graph.add_edge(node_id, dep_node_id)
-                logger.debug(f"Added dependency edge: {node_id} -> {dep_node_id}")
+                logger.debug("Added dependency edge: %s -> %s", node_id, dep_node_id)
     
     def get_node_id(self, resource: NormalizedResource) -> str:
-        """Generate unique node ID for a resource."""
-        if resource.module:
-            return f"{resource.module}.{resource.id}"
-        return resource.id
+        """Generate unique node ID for a resource (cached on the model)."""
+        return resource.address
     
     def _find_dependency_node(self, dep_address: str, source_resource: NormalizedResource) -> Optional[str]:
         """Find node ID for dependency address (handles full/relative/type-only refs)."""
@@ -48,7 +55,7 @@ class DependencyGraph:
             if resource.id == dep_address or resource.type == dep_address:
                 return node_id
         
-        logger.debug(f"Dependency not found in graph: {dep_address}")
+        logger.debug("Dependency not found in graph: %s", dep_address)
         return None
     
     def build_from_resources(self, resources: List[NormalizedResource]) -> None:
@@ -63,26 +70,103 @@ class DependencyGraph:
                     dep_node_id = self._find_dependency_node(dep_address, resource)
                     if dep_node_id and not self.graph.has_edge(node_id, dep_node_id):
                         self.graph.add_edge(node_id, dep_node_id)
-            
+
+            self._downstream_cache.clear()
+
             logger.info(f"Built dependency graph with {self.graph.number_of_nodes()} nodes and {self.graph.number_of_edges()} edges")
             
         except Exception as e:
             raise GraphConstructionError(f"Failed to build dependency graph: {e}")
     
-    def get_downstream_resources(self, resource_id: str) -> Set[str]:
-        """Get all resources that depend on the given resource (downstream)."""
+    def get_downstream_resources(self, resource_id: str) -> FrozenSet[str]:
+        """Get all resources that depend on the given resource (downstream).
+
+        Results are memoized per node; the cache is invalidated whenever the
+        graph mutates, so repeated lookups during analysis skip the traversal.
+        """
+        cached = self._downstream_cache.get(resource_id)
+        if cached is not None:
+            return cached
+
         if resource_id not in self.graph:
-            return set()
-        
-        downstream = set()
-        direct_predecessors = list(self.graph.predecessors(resource_id))
-        
-        for node in direct_predecessors:
-            downstream.add(node)
-            downstream.update(nx.ancestors(self.graph, node))
-        
+            downstream: FrozenSet[str] = frozenset()
+        else:
+            collected: Set[str] = set()
+            for node in self.graph.predecessors(resource_id):
+                collected.add(node)
+                collected.update(nx.ancestors(self.graph, node))
+            downstream = frozenset(collected)
+
+        self._downstream_cache[resource_id] = downstream
         return downstream
     
+    def downstream_counts(self) -> Dict[str, int]:
+        """Per-node transitive dependent counts, filling the memo in bulk.
+
+        Nodes are processed in topological order (dependents first), so each
+        downstream set is one union over the already-computed sets of the
+        node's direct dependents — O(N+E) set work instead of one traversal
+        per node. Falls back to per-node queries if the graph has a cycle.
+        """
+        # Always run the fill pass: the memo may also hold frozenset()
+        # entries for unknown ids queried via get_downstream_resources, so
+        # its size says nothing about which real nodes are filled. The loop
+        # skips nodes that are already cached.
+        cache = self._downstream_cache
+        try:
+            order = list(nx.topological_sort(self.graph))
+        except nx.NetworkXUnfeasible:
+            for node_id in self._resource_map:
+                self.get_downstream_resources(node_id)
+        else:
+            pred = self.graph.pred
+            for node in order:
+                if node in cache:
+                    continue
+                collected: Set[str] = set()
+                for dependent in pred[node]:
+                    collected.add(dependent)
+                    collected.update(cache[dependent])
+                cache[node] = frozenset(collected)
+        return {node_id: len(cache[node_id]) for node_id in self._resource_map}
+
+    def get_downstream_closure(self, seed_ids: Iterable[str]) -> Set[str]:
+        """Get the seeds plus every resource that transitively depends on them.
+
+        Runs one BFS over the reverse-dependency adjacency seeded with all
+        ids at once, so each node is visited at most once no matter how many
+        seeds reach it (vs. one traversal per seed).
+        """
+        # Materialize once: seed_ids may be a one-shot generator and is
+        # iterated again below
+        seeds = set(seed_ids)
+        visited: Set[str] = set(seeds)
+        cache = self._downstream_cache
+
+        # Seeds whose downstream set is already memoized are merged via
+        # set.update on the cached frozenset (C-level union); only the rest
+        # need traversal. A cached closure is complete: anything downstream
+        # of a member is downstream of the seed itself.
+        uncached = []
+        for seed in seeds:
+            cached = cache.get(seed)
+            if cached is not None:
+                visited.update(cached)
+            else:
+                uncached.append(seed)
+
+        queue = deque(node for node in uncached if node in self.graph)
+        pred = self.graph.pred
+
+        while queue:
+            node = queue.popleft()
+            for dependent in pred[node]:
+                if dependent not in visited:
+                    visited.add(dependent)
+                    queue.append(dependent)
+
+        return visited
+
     def get_upstream_resources(self, resource_id: str) -> Set[str]:
         """Get all resources that the given resource depends on (upstream)."""
         if resource_id not in self.graph:
@@ -94,6 +178,11 @@ class DependencyGraph:
         
         return upstream
     
+    @property
+    def nodes(self) -> Dict[str, NormalizedResource]:
+        """Raw node-id -> resource mapping (bind .get in hot loops)."""
+        return self._resource_map
+
     def get_resource(self, node_id: str) -> Optional[NormalizedResource]:
         """Get normalized resource by node ID."""
         return self._resource_map.get(node_id)
@@ -1,6 +1,7 @@
 """Pydantic models for normalized resources."""
 
 from enum import Enum
+from functools import cached_property
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
@@ -23,6 +24,15 @@ class NormalizedResource(BaseModel):
     depends_on: List[str] = Field(default_factory=list, description="List of resource addresses this depends on")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+    @cached_property
+    def address(self) -> str:
+        """Fully-qualified resource id (module-prefixed when in a module).
+
+        Cached: analysis formats this id several times per resource (node
+        ids, shared/critical reporting), so the f-string runs once.
+        """
+        return self.id if not self.module else f"{self.module}.{self.id}"
+
 
 class NormalizedPlan(BaseModel):
     """Normalized Terraform plan - collection of normalized resources."""
@@ -1,9 +1,9 @@
 """Load and validate Terraform plan JSON."""
 
-import json
 from pathlib import Path
 from typing import Dict, Any
 from ..utils.errors import PlanLoadError
+from ..utils.jsonio import loads as json_loads
 from ..utils.logging import get_logger
 
 try:
@@ -14,49 +14,51 @@ except Exception as e:
 logger = get_logger("ingest.plan_loader")
 
 
-def load_plan_json(plan_path: str) -> Dict[str, Any]:
+def load_plan_json(plan_path: str, plan_data: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Load and validate Terraform plan JSON file.
-    
+
     Args:
         plan_path: Path to Terraform plan JSON file
-        
+        plan_data: Already-parsed plan dict; when supplied the file is not
+            read or parsed again, only validated
+
     Returns:
         Parsed and validated plan data
-        
+
     Raises:
         PlanLoadError: If file cannot be loaded or is invalid
     """
-    path = Path(plan_path)
-    
-    if not path.exists():
-        raise PlanLoadError(
-            f"Plan file not found: {plan_path}. "
-            "Please check the file path and ensure the file exists. "
-            "Generate a plan using: terraform plan -json > plan.json"
-        )
-    
-    if not path.is_file():
-        raise PlanLoadError(
-            f"Path is not a file: {plan_path}. "
-            "Please provide a valid Terraform plan JSON file."
-        )
-    
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            plan_data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise PlanLoadError(
-            f"Invalid JSON in plan file: {e}. "
-            "Please ensure the file is valid JSON. "
-            "Generate a plan using: terraform plan -json > plan.json"
-        )
-    except Exception as e:
-        raise PlanLoadError(
-            f"Error reading plan file: {e}. "
-            "Please check file permissions and try again."
-        )
-    
+    if plan_data is None:
+        path = Path(plan_path)
+
+        if not path.exists():
+            raise PlanLoadError(
+                f"Plan file not found: {plan_path}. "
+                "Please check the file path and ensure the file exists. "
+                "Generate a plan using: terraform plan -json > plan.json"
+            )
+
+        if not path.is_file():
+            raise PlanLoadError(
+                f"Path is not a file: {plan_path}. "
+                "Please provide a valid Terraform plan JSON file."
+            )
+
+        try:
+            plan_data = json_loads(path.read_bytes())
+        except ValueError as e:
+            raise PlanLoadError(
+                f"Invalid JSON in plan file: {e}. "
+                "Please ensure the file is valid JSON. "
+                "Generate a plan using: terraform plan -json > plan.json"
+            )
+        except Exception as e:
+            raise PlanLoadError(
+                f"Error reading plan file: {e}. "
+                "Please check file permissions and try again."
+            )
+
     # Validate plan structure
     try:
         validate_plan_structure(plan_data)
@@ -106,6 +106,36 @@ def _get_overall_explanation_id(attrs) -> ExplanationID:
         return ExplanationID.SINGLE_RESOURCE_LOW_RISK
 
 
+def get_explanation_id(output: CoreOutput, resource_id: str = None) -> ExplanationID:
+    """
+    Compute only the explanation ID, without rendering explanation text.
+
+    Callers like policy checks need just the deterministic identifier;
+    this skips the string building the explain_* functions do.
+
+    Args:
+        output: CoreOutput from analysis
+        resource_id: Optional resource identifier for resource-level ID
+
+    Returns:
+        ExplanationID for the overall analysis or the given resource
+    """
+    attrs = output.risk_attributes
+
+    if resource_id is None:
+        return _get_overall_explanation_id(attrs)
+
+    for dep in attrs.shared_dependencies:
+        if dep.resource_id == resource_id or resource_id in dep.resource_id:
+            return _get_resource_explanation_id(dep, True)
+
+    for crit in attrs.critical_infrastructure:
+        if crit.resource_id == resource_id or resource_id in crit.resource_id:
+            return ExplanationID.RESOURCE_CRITICAL_NO_DEPENDENTS
+
+    return ExplanationID.RESOURCE_NOT_FOUND
+
+
 def explain_resource(output: CoreOutput, resource_id: str) -> str:
     """
     Generate resource-specific explanation (deterministic, template-based).
@@ -0,0 +1,69 @@
+"""JSON parsing/serialization helpers (orjson-accelerated when installed)."""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HAVE_ORJSON = orjson is not None
+
+# Files above this size are memory-mapped rather than read into the heap;
+# below it the mmap setup costs more than the copy it saves.
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON using orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def loads_path(path: Union[str, Path]) -> Any:
+    """Parse a JSON file.
+
+    Large files are memory-mapped and handed to orjson (which accepts any
+    buffer), so the kernel pages in only what the parser touches instead of
+    the whole file being copied into a Python object first. Small files and
+    the stdlib fallback use a plain read.
+    """
+    path = Path(path)
+    if orjson is not None:
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = 0
+        if size > _MMAP_THRESHOLD:
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # orjson takes any buffer via memoryview, zero-copy;
+                    # release before the mmap closes or close() raises
+                    mv = memoryview(mm)
+                    try:
+                        return orjson.loads(mv)
+                    finally:
+                        mv.release()
+    return loads(path.read_bytes())
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_indented(obj: Any) -> str:
+    """Serialize to 2-space-indented JSON text (orjson when available).
+
+    The stdlib fallback keeps ensure_ascii off so both encoders emit the
+    same UTF-8 text for non-ASCII resource names.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)